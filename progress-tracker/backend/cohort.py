@@ -0,0 +1,157 @@
+"""
+Cohort - Progress score distributions for many applicants
+Profiles arrive as a stream and are processed in fixed-size chunks: each
+chunk's events are bucketed into periods and cumulated as one NumPy job,
+then folded into per-period running stats and fixed-width histograms. Only
+the histograms outlive a chunk, so memory does not grow with cohort size;
+percentiles are read off the histograms (exact to within one bin width)
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import os
+
+import numpy as np
+
+from timeline import CGPA_WEIGHT, extract_events, period_label
+
+# Defaults, overridable through the environment
+COHORT_CHUNK_SIZE = int(os.getenv("PROGRESS_COHORT_CHUNK_SIZE", "1000"))
+COHORT_BIN_WIDTH = float(os.getenv("PROGRESS_COHORT_BIN_WIDTH", "5"))
+COHORT_MIN_BIN_WIDTH = float(os.getenv("PROGRESS_COHORT_MIN_BIN_WIDTH", "0.5"))
+COHORT_MAX_BINS = int(os.getenv("PROGRESS_COHORT_MAX_BINS", "2000"))  # per period, last one is overflow
+COHORT_EXPORT_DIR = os.getenv("PROGRESS_COHORT_EXPORT_DIR")  # unset = exports disabled
+COHORT_MAX_LINE_BYTES = int(os.getenv("PROGRESS_COHORT_MAX_LINE_BYTES", str(1 << 20)))  # One profile
+
+# A CGPA above this is a percentage or a typo; such applicants count without one
+COHORT_MAX_CGPA = 10
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def unwrap_profile(record: Dict[str, Any], fallback_id: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    (applicant ID, profile) from one input record: a bare profile,
+    {"id", "profile"}, or a saved main-app response {"success", "data"}
+    """
+    profile = record.get("profile") or record.get("data") or record
+    applicant_id = record.get("id") or profile.get("id") or profile.get("userId") or fallback_id
+    return applicant_id, profile
+
+
+class CohortAccumulator:
+    """Per-period running stats and score histograms over every chunk seen"""
+
+    def __init__(self, bounds: List[date], granularity: str, bin_width: float = COHORT_BIN_WIDTH,
+                 percentiles: Iterable[float] = DEFAULT_PERCENTILES, max_bins: int = COHORT_MAX_BINS):
+        self.bounds = bounds
+        self.granularity = granularity
+        self.periods = len(bounds) - 1
+        self.bin_width = max(bin_width, COHORT_MIN_BIN_WIDTH)
+        # Scores at or above (max_bins - 1) * bin_width share the last bin
+        self.max_bins = max(2, max_bins)
+        self.percentiles = tuple(percentiles)
+        # Exclusive upper bound of each period, as day ordinals
+        self._period_ends = np.array([d.toordinal() for d in bounds[1:]], dtype=np.int64)
+        self.count = 0
+        self._sum = np.zeros(self.periods)
+        self._min = np.full(self.periods, np.inf)
+        self._max = np.full(self.periods, -np.inf)
+        self._histograms = np.zeros((self.periods, 1), dtype=np.int64)  # periods x bins, grown on demand
+
+    def add_chunk(self, profiles: List[Dict[str, Any]]) -> np.ndarray:
+        """Fold a chunk of profiles in; returns its applicants x periods score matrix"""
+        n = len(profiles)
+        periods = self.periods
+        owners: List[int] = []
+        days: List[int] = []
+        points: List[float] = []
+        cgpa = np.zeros(n)
+        for i, profile in enumerate(profiles):
+            events = extract_events(profile)
+            cgpa[i] = events["cgpa"] if events["cgpa"] <= COHORT_MAX_CGPA else 0.0
+            for day, score in events["repos"] + events["certificates"]:
+                owners.append(i)
+                days.append(day.toordinal())
+                points.append(score)
+
+        # Period each event first counts in; earlier events count from the first
+        period = np.searchsorted(self._period_ends, np.asarray(days, dtype=np.int64), side="right")
+        owner = np.asarray(owners, dtype=np.int64)
+        in_range = period < periods
+        gained = np.bincount(
+            owner[in_range] * periods + period[in_range],
+            weights=np.asarray(points, dtype=np.float64)[in_range],
+            minlength=n * periods
+        ).reshape(n, periods)
+        scores = gained.cumsum(axis=1) + cgpa[:, None] * CGPA_WEIGHT
+
+        self.count += n
+        self._sum += scores.sum(axis=0)
+        np.minimum(self._min, scores.min(axis=0, initial=np.inf), out=self._min)
+        np.maximum(self._max, scores.max(axis=0, initial=-np.inf), out=self._max)
+
+        bins = np.minimum(scores // self.bin_width, self.max_bins - 1).astype(np.int64)
+        width = max(self._histograms.shape[1], int(bins.max(initial=0)) + 1)
+        if width > self._histograms.shape[1]:
+            grown = np.zeros((periods, width), dtype=np.int64)
+            grown[:, :self._histograms.shape[1]] = self._histograms
+            self._histograms = grown
+        # One bincount for every period: offset each period's bins by its row
+        flat = (bins + np.arange(periods)[None, :] * width).ravel()
+        self._histograms += np.bincount(flat, minlength=periods * width).reshape(periods, width)
+        return scores
+
+    def _percentile(self, histogram: np.ndarray, low: float, high: float, q: float) -> float:
+        """Linear interpolation inside the histogram bin holding the q-th percentile"""
+        cdf = np.cumsum(histogram)
+        target = q / 100 * cdf[-1]
+        b = int(np.searchsorted(cdf, target, side="left"))
+        below = cdf[b - 1] if b > 0 else 0
+        inside = histogram[b]
+        fraction = (target - below) / inside if inside else 0
+        start = b * self.bin_width
+        # The overflow bin has no fixed upper edge; it ends at the largest score seen
+        end = high if b == self.max_bins - 1 else start + self.bin_width
+        return float(min(max(start + fraction * (end - start), low), high))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One distribution per period"""
+        rows = []
+        for p, start in enumerate(self.bounds[:-1]):
+            row: Dict[str, Any] = {
+                "type": "period",
+                "period": period_label(start, self.granularity),
+                "start": start.isoformat(),
+                "count": self.count
+            }
+            if self.count:
+                histogram = self._histograms[p]
+                low, high = float(self._min[p]), float(self._max[p])
+                overflow = int(histogram[self.max_bins - 1]) if len(histogram) == self.max_bins else 0
+                nonzero = np.flatnonzero(histogram[:self.max_bins - 1]) if overflow else np.flatnonzero(histogram)
+                first = int(nonzero[0]) if len(nonzero) else self.max_bins - 1
+                last = int(nonzero[-1]) if len(nonzero) else first - 1
+                row.update({
+                    "mean": round(float(self._sum[p] / self.count), 2),
+                    "min": round(low, 2),
+                    "max": round(high, 2),
+                    **{f"p{q:g}": round(self._percentile(histogram, low, high, q), 2) for q in self.percentiles},
+                    "histogram": {
+                        "bin_width": self.bin_width,
+                        "start": first * self.bin_width,
+                        "counts": histogram[first:last + 1].tolist(),
+                        # Scores from (max_bins - 1) * bin_width up, not spread over bins
+                        "overflow": overflow
+                    }
+                })
+            rows.append(row)
+        return rows
+
+
+def export_path(name: str) -> Optional[str]:
+    """Path of an NDJSON export in COHORT_EXPORT_DIR; None if exports are off or it is missing"""
+    if not COHORT_EXPORT_DIR:
+        return None
+    path = os.path.join(COHORT_EXPORT_DIR, os.path.basename(name))
+    return path if os.path.isfile(path) else None
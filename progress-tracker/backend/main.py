@@ -1,10 +1,51 @@
 
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 import uvicorn
+import httpx
+import asyncio
+import hmac
+import itertools
+import json
+import math
+import os
+import tempfile
 
-app = FastAPI(title="Progress Tracker Dashboard")
+from timeline import TimelineCache, build_timeline, parse_date_param, period_bounds
+from cohort import COHORT_BIN_WIDTH, COHORT_CHUNK_SIZE, COHORT_MAX_LINE_BYTES, COHORT_MIN_BIN_WIDTH, DEFAULT_PERCENTILES, CohortAccumulator, export_path, unwrap_profile
+from static_assets import StaticAssets
+
+# Main app backend URL
+MAIN_APP_URL = os.getenv("PROGRESS_MAIN_APP_URL", "http://localhost:3000")
+MAIN_APP_TIMEOUT = float(os.getenv("PROGRESS_MAIN_APP_TIMEOUT", "10"))
+# Cohort endpoints see every applicant; they are hidden unless this is set
+ADMIN_TOKEN = os.getenv("PROGRESS_ADMIN_TOKEN")
+
+# Shared outbound client, created in the lifespan hook
+http_client: httpx.AsyncClient | None = None
+
+# Computed timelines keyed by profile fingerprint and range
+timeline_cache = TimelineCache()
+
+# Dashboard files, hashed and precompressed once at startup
+static_assets = StaticAssets("../frontend/static", html=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared HTTP client on startup and close it on shutdown"""
+    global http_client
+    http_client = httpx.AsyncClient(timeout=MAIN_APP_TIMEOUT)
+    yield
+    await http_client.aclose()
+    http_client = None
+
+
+app = FastAPI(title="Progress Tracker Dashboard", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -15,8 +56,194 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Serve static files (HTML, CSS, JS)
-app.mount("/", StaticFiles(directory="../frontend/static", html=True), name="static")
+
+class TimelineRequest(BaseModel):
+    profile: dict
+    start: str | None = None
+    end: str | None = None
+    granularity: str = "month"
+
+
+def timeline_response(profile: dict, start: str | None, end: str | None, granularity: str) -> dict:
+    """Build a timeline, mapping bad parameters to 400"""
+    try:
+        events, timeline, cached = build_timeline(
+            profile, parse_date_param(start), parse_date_param(end), granularity, timeline_cache
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "success": True,
+        "granularity": granularity,
+        "timeline": timeline,
+        "summary": {
+            "cgpa": events["cgpa"],
+            "github_repos": len(events["repos"]),
+            "certificates": events["certificate_count"]
+        },
+        "cached": cached
+    }
+
+
+@app.get("/api/timeline")
+async def get_timeline(
+    start: str | None = None,
+    end: str | None = None,
+    granularity: str = "month",
+    authorization: str | None = Header(None)
+):
+    """
+    Progress timeline for the caller's profile, fetched from the main app
+    start/end: YYYY, YYYY-MM or YYYY-MM-DD; granularity: day, week, month, quarter, year
+    """
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Auth token required")
+    try:
+        resp = await http_client.get(
+            f"{MAIN_APP_URL}/api/applicant/profile",
+            headers={"Authorization": authorization}
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=502, detail=f"Connection to main app failed: {str(e)}")
+    if resp.status_code != 200:
+        raise HTTPException(status_code=401, detail="Failed to fetch profile. Check auth token.")
+    data = resp.json()
+    if not data.get("success") or not data.get("data"):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return timeline_response(data["data"], start, end, granularity)
+
+
+@app.post("/api/timeline")
+async def post_timeline(request: TimelineRequest):
+    """Progress timeline for a profile supplied in the body"""
+    return timeline_response(request.profile, request.start, request.end, request.granularity)
+
+
+def require_admin(token: str | None):
+    """Constant-time check against PROGRESS_ADMIN_TOKEN; 404 while it is unset"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if token is None or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+async def body_lines(request: Request) -> AsyncIterator[bytes]:
+    """NDJSON lines of a request body as it streams in, each at most COHORT_MAX_LINE_BYTES"""
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        # The unfinished tail is checked too, so a line without newlines cannot grow unbounded
+        if len(pending) > COHORT_MAX_LINE_BYTES or any(len(line) > COHORT_MAX_LINE_BYTES for line in lines):
+            raise HTTPException(status_code=413, detail=f"Lines must be at most {COHORT_MAX_LINE_BYTES} bytes")
+        for line in lines:
+            yield line
+    yield pending
+
+
+async def export_lines(path: str) -> AsyncIterator[bytes]:
+    """Lines of a local NDJSON export, read a chunk at a time off the event loop"""
+    with open(path, "rb") as f:
+        while True:
+            lines = await asyncio.to_thread(list, itertools.islice(f, COHORT_CHUNK_SIZE))
+            if not lines:
+                return
+            for line in lines:
+                yield line
+
+
+@app.post("/api/cohort/timeline")
+async def cohort_timeline(
+    request: Request,
+    start: str | None = None,
+    end: str | None = None,
+    granularity: str = "month",
+    percentiles: str | None = None,
+    bin_width: float = COHORT_BIN_WIDTH,
+    include_series: bool = False,
+    export: str | None = None,
+    x_admin_token: str | None = Header(None)
+):
+    """
+    Score distributions per period for a whole cohort, streamed as NDJSON
+    Profiles come from the NDJSON request body (one profile, {"id", "profile"}
+    or saved profile response per line) or from a local export file. Emits an
+    {"type": "applicant"} line per profile when include_series is set, then
+    one {"type": "period"} line per period and a final {"type": "done"}.
+    Admin only (X-Admin-Token), since it reads exports and per-applicant series
+    """
+    require_admin(x_admin_token)
+    try:
+        bounds = period_bounds(parse_date_param(start), parse_date_param(end), granularity)
+        qs = [float(q) for q in percentiles.split(",")] if percentiles else list(DEFAULT_PERCENTILES)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not all(0 <= q <= 100 for q in qs):
+        raise HTTPException(status_code=400, detail="Percentiles must be in 0..100")
+    if not (math.isfinite(bin_width) and bin_width >= COHORT_MIN_BIN_WIDTH):
+        raise HTTPException(status_code=400, detail=f"bin_width must be at least {COHORT_MIN_BIN_WIDTH:g}")
+    
+    if export is not None:
+        path = export_path(export)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Export not found")
+        lines = export_lines(path)
+    else:
+        lines = body_lines(request)
+    
+    # The body is consumed here, chunk by chunk, rather than inside the response
+    # generator: a streaming response also waits on the client's disconnect
+    # message and would race request.stream() for it
+    accumulator = CohortAccumulator(bounds, granularity, bin_width, qs)
+    # With include_series the applicant lines are spooled to disk, not held
+    series = tempfile.TemporaryFile() if include_series else None
+    labels = [row["period"] for row in accumulator.summary()]
+    
+    def fold(ids, chunk):
+        scores = accumulator.add_chunk(chunk)
+        if series is not None:
+            series.write("".join(
+                json.dumps({"type": "applicant", "id": applicant_id, "periods": labels,
+                            "scores": row.round(2).tolist()}) + "\n"
+                for applicant_id, row in zip(ids, scores)
+            ).encode())
+    
+    skipped = 0
+    ids, chunk = [], []
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            applicant_id, profile = unwrap_profile(json.loads(line), len(ids) + accumulator.count)
+            if not isinstance(profile, dict):
+                raise ValueError
+        except (ValueError, AttributeError):
+            skipped += 1
+            continue
+        ids.append(applicant_id)
+        chunk.append(profile)
+        if len(chunk) >= COHORT_CHUNK_SIZE:
+            await asyncio.to_thread(fold, ids, chunk)
+            ids, chunk = [], []
+    if chunk:
+        await asyncio.to_thread(fold, ids, chunk)
+    summary = accumulator.summary()
+    
+    def events():
+        if series is not None:
+            with series:
+                series.seek(0)
+                while block := series.read(1 << 16):
+                    yield block
+        for row in summary:
+            yield json.dumps(row) + "\n"
+        yield json.dumps({"type": "done", "applicants": accumulator.count, "skipped": skipped}) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+# Serve static files (HTML, CSS, JS); mounted last so the API routes above take precedence
+app.mount("/", static_assets, name="static")
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8006, reload=True)
@@ -0,0 +1,31 @@
+"""
+Test setup - backend modules import each other by bare name, as they do
+when uvicorn runs main.py from this directory. skill-twin has its own
+`main`, so run each app's tests on their own:
+    cd progress-tracker/backend && python -m pytest -q
+"""
+
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """TestClient over the app, with the cohort endpoints enabled"""
+    import main
+    monkeypatch.setattr(main, "ADMIN_TOKEN", ADMIN_TOKEN)
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def admin():
+    """Headers that pass the cohort endpoints' admin check"""
+    return {"X-Admin-Token": ADMIN_TOKEN}
@@ -0,0 +1,77 @@
+"""Cohort timelines: admin access, request bounds, and scoring against single timelines"""
+
+import json
+
+import pytest
+
+import main
+from cohort import COHORT_MAX_LINE_BYTES
+
+PARAMS = {"start": "2026-01", "end": "2026-03"}
+
+
+def profile(cgpa, repos=0):
+    return {
+        "resume": {"cgpa": cgpa},
+        "githubRepos": [{"createdAt": "2026-02-10", "languages": ["Python"]} for _ in range(repos)],
+    }
+
+
+def ndjson(*records):
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+def cohort(client, admin, body, **params):
+    response = client.post("/api/cohort/timeline", params={**PARAMS, **params}, content=body, headers=admin)
+    assert response.status_code == 200, response.text
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_hidden_without_an_admin_token(client, admin, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+    response = client.post("/api/cohort/timeline", content=ndjson(profile("8")), headers=admin)
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+def test_requires_the_admin_token(client, headers):
+    response = client.post("/api/cohort/timeline", content=ndjson(profile("8")), headers=headers)
+    assert response.status_code == 403
+
+
+def test_rejects_overlong_lines(client, admin):
+    line = json.dumps({"resume": {"cgpa": "8"}, "pad": "x" * COHORT_MAX_LINE_BYTES})
+    response = client.post("/api/cohort/timeline", content=line, headers=admin)
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("params", [
+    {"percentiles": "10,101"},
+    {"percentiles": "ten"},
+    {"bin_width": "0"},
+    {"bin_width": "nan"},
+    {"start": "2026-13"},
+])
+def test_rejects_bad_parameters(client, admin, params):
+    response = client.post("/api/cohort/timeline", params=params, content=ndjson(profile("8")), headers=admin)
+    assert response.status_code == 400
+
+
+def test_summarizes_the_cohort(client, admin):
+    lines = cohort(client, admin, ndjson(profile("8", repos=1), {"id": "b", "profile": profile("6")}) + "not json\n",
+                   include_series="true")
+    applicants = [line for line in lines if line["type"] == "applicant"]
+    periods = [line for line in lines if line["type"] == "period"]
+    assert lines[-1] == {"type": "done", "applicants": 2, "skipped": 1}
+    assert [a["id"] for a in applicants] == [0, "b"]
+    assert [p["period"] for p in periods] == applicants[0]["periods"]
+    assert all(p["count"] == 2 and p["min"] <= p["p50"] <= p["max"] for p in periods)
+
+
+def test_cgpa_cap_applies_to_cohorts_only(client, admin):
+    # A percentage, not a 10-point CGPA: cohorts drop it, a single timeline keeps user-021's scoring
+    single = client.post("/api/timeline", json={"profile": profile("85%"), **PARAMS}).json()
+    (applicant,) = [line for line in cohort(client, admin, ndjson(profile("85%")), include_series="true")
+                    if line["type"] == "applicant"]
+    assert applicant["scores"] == [0.0] * len(applicant["scores"])
+    assert [period["score"] for period in single["timeline"]] == [850.0] * len(single["timeline"])
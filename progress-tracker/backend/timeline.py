@@ -0,0 +1,250 @@
+"""
+Timeline - Cumulative progress scores per period
+Server-side replacement for the dashboard's processRealData: GitHub repos
+and certificates become dated score events, sorted once, and a single sweep
+over the period boundaries yields every period's running totals. Results
+are cached by a fingerprint of the events, so unrelated profile edits
+(READMEs, names) and repeated requests reuse the same computation
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import calendar
+import hashlib
+import json
+import os
+import re
+
+# Defaults, overridable through the environment
+TIMELINE_CACHE_SIZE = int(os.getenv("PROGRESS_TIMELINE_CACHE_SIZE", "1024"))
+TIMELINE_MAX_PERIODS = int(os.getenv("PROGRESS_TIMELINE_MAX_PERIODS", "1000"))
+TIMELINE_DEFAULT_PERIODS = 6
+
+GRANULARITIES = ("day", "week", "month", "quarter", "year")
+
+# Same weights as the dashboard
+REPO_BASE_SCORE = 20
+REPO_LANGUAGE_SCORE = 5
+CERT_SCORE = 50
+CGPA_WEIGHT = 10
+
+_NUMBER = re.compile(r"[\d.]+")
+
+Event = Tuple[date, int]  # (day it counts from, score)
+
+
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    """Calendar day (UTC) of an ISO timestamp, None if missing or invalid"""
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+def parse_date_param(value: Optional[str]) -> Optional[date]:
+    """Range bound from a query string: YYYY, YYYY-MM or YYYY-MM-DD"""
+    if not value:
+        return None
+    parts = value.split("-")
+    try:
+        if len(parts) > 3:
+            raise ValueError
+        return date(int(parts[0]), int(parts[1]) if len(parts) > 1 else 1, int(parts[2]) if len(parts) > 2 else 1)
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY, YYYY-MM or YYYY-MM-DD")
+
+
+def parse_cgpa(profile: Dict[str, Any]) -> float:
+    """First number in the resume's CGPA string, 0 when absent"""
+    resume = profile.get("resume") or {}
+    match = _NUMBER.search(str(resume.get("cgpa") or ""))
+    try:
+        return float(match.group(0)) if match else 0.0
+    except ValueError:
+        return 0.0
+
+
+def extract_events(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """The parts of a profile the timeline depends on, events sorted by day"""
+    repos: List[Event] = []
+    for repo in profile.get("githubRepos") or []:
+        day = _parse_day(repo.get("fetchedAt") or repo.get("lastUpdated"))
+        if day is not None:
+            languages = repo.get("languages") or []
+            repos.append((day, REPO_BASE_SCORE + len(languages) * REPO_LANGUAGE_SCORE))
+
+    certs: List[Event] = []
+    for cert in profile.get("certificates") or []:
+        day = _parse_day(cert.get("uploadedAt") or cert.get("processedAt"))
+        if day is not None:
+            certs.append((day, CERT_SCORE))
+
+    repos.sort()
+    certs.sort()
+    return {
+        "cgpa": parse_cgpa(profile),
+        "repos": repos,
+        "certificates": certs,
+        "certificate_count": len(profile.get("certificates") or [])
+    }
+
+
+def fingerprint(events: Dict[str, Any]) -> str:
+    """Stable hash of extracted events"""
+    canonical = json.dumps(
+        [events["cgpa"], events["certificate_count"],
+         [(d.isoformat(), s) for d, s in events["repos"]],
+         [(d.isoformat(), s) for d, s in events["certificates"]]],
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def period_start(day: date, granularity: str) -> date:
+    """First day of the period containing `day`"""
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())  # Monday
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+    return date(day.year, 1, 1)
+
+
+def next_period(start: date, granularity: str) -> date:
+    """First day of the period after the one starting at `start`"""
+    if granularity == "day":
+        return start + timedelta(days=1)
+    if granularity == "week":
+        return start + timedelta(days=7)
+    months = {"month": 1, "quarter": 3, "year": 12}[granularity]
+    index = start.year * 12 + start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def period_label(start: date, granularity: str) -> str:
+    """Chart label; months match the dashboard's 'Jan 2024'"""
+    if granularity == "day":
+        return start.isoformat()
+    if granularity == "week":
+        return f"Week of {start.isoformat()}"
+    if granularity == "month":
+        return f"{calendar.month_abbr[start.month]} {start.year}"
+    if granularity == "quarter":
+        return f"Q{(start.month - 1) // 3 + 1} {start.year}"
+    return str(start.year)
+
+
+def period_bounds(start: Optional[date], end: Optional[date], granularity: str) -> List[date]:
+    """
+    Period starts from the one containing `start` to the one containing `end`,
+    plus the exclusive bound after the last. Defaults to the last
+    TIMELINE_DEFAULT_PERIODS periods up to today
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Granularity must be one of {', '.join(GRANULARITIES)}")
+    last = period_start(end or date.today(), granularity)
+    if start is None:
+        first = last
+        for _ in range(TIMELINE_DEFAULT_PERIODS - 1):
+            # Step back one period from just before the current one's start
+            first = period_start(first - timedelta(days=1), granularity)
+    else:
+        first = period_start(start, granularity)
+    if first > last:
+        raise ValueError("Start must not be after end")
+
+    bounds = [first]
+    while bounds[-1] <= last:
+        if len(bounds) > TIMELINE_MAX_PERIODS:
+            raise ValueError(f"At most {TIMELINE_MAX_PERIODS} periods per timeline")
+        bounds.append(next_period(bounds[-1], granularity))
+    return bounds
+
+
+def cumulative_at(events: List[Event], bounds: List[date]) -> List[int]:
+    """
+    Running score total before each exclusive bound, bounds[1:], in one sweep
+    over the sorted events and the sorted bounds
+    """
+    totals = []
+    running = 0
+    index = 0
+    for bound in bounds[1:]:
+        while index < len(events) and events[index][0] < bound:
+            running += events[index][1]
+            index += 1
+        totals.append(running)
+    return totals
+
+
+def compute_timeline(events: Dict[str, Any], bounds: List[date], granularity: str) -> List[Dict[str, Any]]:
+    """One entry per period, in the dashboard's {month, score, details} shape"""
+    github = cumulative_at(events["repos"], bounds)
+    certs = cumulative_at(events["certificates"], bounds)
+    cgpa = events["cgpa"]
+    timeline = []
+    for i, start in enumerate(bounds[:-1]):
+        label = period_label(start, granularity)
+        timeline.append({
+            "month": label,
+            "start": start.isoformat(),
+            "end": (bounds[i + 1] - timedelta(days=1)).isoformat(),
+            "score": round(cgpa * CGPA_WEIGHT + github[i] + certs[i], 2),
+            "details": {
+                "cgpa": cgpa,
+                "github_score": github[i],
+                "cert_score": certs[i]
+            }
+        })
+    return timeline
+
+
+class TimelineCache:
+    """Bounded LRU of computed timelines keyed by (event fingerprint, periods)"""
+
+    def __init__(self, max_entries: int = TIMELINE_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        timeline = self._entries.get(key)
+        if timeline is not None:
+            self._entries.move_to_end(key)
+        return timeline
+
+    def put(self, key: tuple, timeline: List[Dict[str, Any]]):
+        self._entries[key] = timeline
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def build_timeline(profile: Dict[str, Any], start: Optional[date], end: Optional[date], granularity: str,
+                   cache: Optional[TimelineCache] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]], bool]:
+    """
+    Timeline for a profile over a range, through the cache when given
+    Returns (events, timeline, cached)
+    """
+    events = extract_events(profile)
+    bounds = period_bounds(start, end, granularity)
+    key = (fingerprint(events), granularity, bounds[0], bounds[-1])
+    if cache is not None:
+        timeline = cache.get(key)
+        if timeline is not None:
+            return events, timeline, True
+    timeline = compute_timeline(events, bounds, granularity)
+    if cache is not None:
+        cache.put(key, timeline)
+    return events, timeline, False
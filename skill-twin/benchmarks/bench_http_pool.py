@@ -0,0 +1,90 @@
+"""
+Benchmark - Pooled vs per-request httpx clients
+Hits a local keep-alive stub server the way sync_from_main_app and
+fetch_github_data do, once with a fresh AsyncClient per call (the old code)
+and once through the shared pooled client, and reports p50/p99 latency.
+Over plain localhost HTTP this only shows the TCP handshake and client setup
+saved; with TLS to a remote host the gap is larger
+
+Run from the skill-twin directory:
+    python benchmarks/bench_http_pool.py
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_pool import create_http_client  # noqa: E402
+
+REQUESTS = 500
+CONCURRENCY = 10
+BODY = b'{"success": true, "data": {"user": {"name": "Stub"}, "derivedSkills": []}}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections alive
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def timed_calls(url, get):
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            resp = await get(url)
+            resp.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    return latencies
+
+
+async def per_request_client(url):
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        return await client.get(url)
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{label:<22} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+
+async def run(url):
+    report("client per request", await timed_calls(url, per_request_client))
+    async with create_http_client() as client:
+        await client.get(url)  # Warm the pool
+        report("shared pooled client", await timed_calls(url, client.get))
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(run(f"http://127.0.0.1:{server.server_port}/api/applicant/profile"))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark - Monte Carlo scenario bands
+Times SkillTwin.simulate_scenarios for the budget case, 10k paths x 100
+skills x 120 months, against the 200 ms target. Each run uses a fresh seed
+so the memoized result is never reused
+
+Run from the skill-twin directory:
+    python benchmarks/bench_scenarios.py
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from twin_core import SkillTwin  # noqa: E402
+
+SKILLS = 100
+PATHS = 10000
+MONTHS = 120
+RUNS = 20
+BUDGET_MS = 200
+
+
+def main():
+    rng = random.Random(7)
+    twin = SkillTwin()
+    twin.update_skills((f"skill-{i}", rng.uniform(0.5, 8.0), "resume") for i in range(SKILLS))
+    boosts = {f"skill-{i}": 0.2 for i in range(0, SKILLS, 10)}
+
+    timings = []
+    for seed in range(RUNS):
+        start = time.perf_counter()
+        twin.simulate_scenarios(MONTHS, PATHS, seed, boosts=boosts)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p50 = statistics.median(timings)
+    worst = timings[-1]
+    print(f"{PATHS} paths x {SKILLS} skills x {MONTHS} months")
+    print(f"p50 {p50:7.2f} ms   max {worst:7.2f} ms   budget {BUDGET_MS} ms   {'ok' if worst <= BUDGET_MS else 'OVER'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark - Skill matching cost as SKILL_DB grows
+Compares the old per-skill regex loop (two scans per skill) with the
+single-pass SkillMatcher on a synthetic 10-page resume
+
+Run from the skill-twin directory:
+    python benchmarks/bench_skill_matcher.py
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser import SKILL_DB  # noqa: E402
+from skill_matcher import SkillMatcher  # noqa: E402
+
+DB_SIZES = [90, 500, 1000, 2500, 5000, 10000]
+PAGES = 10
+WORDS_PER_PAGE = 500
+
+
+def regex_count(skills, text):
+    """The matching loop parse_resume used before SkillMatcher"""
+    counts = {}
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text):
+            counts[skill] = len(re.findall(pattern, text))
+    return counts
+
+
+def synthetic_skills(size, rng):
+    """Real SKILL_DB entries padded with made-up skill names"""
+    skills = list(SKILL_DB)
+    while len(skills) < size:
+        word = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+        skills.append(word if rng.random() < 0.8 else f"{word} {skills[rng.randrange(len(skills))]}")
+    return skills[:size]
+
+
+def synthetic_resume(skills, rng):
+    filler = ["experience", "built", "team", "project", "using", "with", "and", "the", "led", "designed"]
+    words = []
+    for _ in range(PAGES * WORDS_PER_PAGE):
+        words.append(rng.choice(skills) if rng.random() < 0.1 else rng.choice(filler))
+    return " ".join(words).lower()
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'skills':>8} {'build ms':>10} {'regex ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for size in DB_SIZES:
+        skills = synthetic_skills(size, rng)
+        text = synthetic_resume(skills, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build = time.perf_counter() - start
+
+        # Both engines must agree before their timings mean anything
+        assert matcher.count(text) == regex_count(skills, text)
+
+        repeat = 3 if size <= 1000 else 1
+        regex_time = best_of(lambda: regex_count(skills, text), repeat)
+        matcher_time = best_of(lambda: matcher.count(text), 3)
+        print(f"{size:>8} {build * 1000:>10.1f} {regex_time * 1000:>10.1f} "
+              f"{matcher_time * 1000:>11.1f} {regex_time / matcher_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
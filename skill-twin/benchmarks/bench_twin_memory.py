@@ -0,0 +1,80 @@
+"""
+Benchmark - Bytes per SkillTwin
+Compares the old dict-per-skill state (four keys and an ISO timestamp string
+per skill) with the column-backed SkillTwin, for twins of various sizes.
+The SkillTwin figure includes its score history (one raw point per skill
+here), which the old state did not keep at all
+
+Run from the skill-twin directory:
+    python benchmarks/bench_twin_memory.py
+"""
+
+from datetime import datetime
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser import SKILL_DB  # noqa: E402
+from twin_core import SkillTwin  # noqa: E402
+
+TWINS = 2000
+SKILLS_PER_TWIN = [10, 30, 70]
+
+
+def legacy_twin(updates):
+    """The state dict SkillTwin held before the column layout"""
+    state = {
+        "name": "Guest",
+        "skills": {},
+        "attributes": {"velocity": 0.0, "consistency": 0.0, "total_skills": 0},
+        "last_updated": None,
+        "github_connected": False,
+        "resume_uploaded": False
+    }
+    for name, impact, source in updates:
+        state["skills"][name.lower().strip()] = {
+            "score": round(min(impact, 10.0), 2),
+            "velocity": round(impact * 0.1, 3),
+            "source": source,
+            "last_update": datetime.now().isoformat()
+        }
+    state["last_updated"] = datetime.now().isoformat()
+    return state
+
+
+def column_twin(updates):
+    twin = SkillTwin()
+    twin.update_skills(updates)
+    return twin
+
+
+def bytes_per_twin(factory, workloads):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    twins = [factory(updates) for updates in workloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del twins
+    return (after - before) / len(workloads)
+
+
+def main():
+    rng = random.Random(7)
+    skills = list(SKILL_DB)
+    print(f"{'skills':>7} {'legacy B/twin':>14} {'column B/twin':>14} {'saving':>7}")
+    for size in SKILLS_PER_TWIN:
+        # Fresh name strings per twin, as they arrive from requests
+        workloads = [
+            [("".join(name), rng.uniform(0.5, 3.0), "resume") for name in rng.sample(skills, size)]
+            for _ in range(TWINS)
+        ]
+        legacy = bytes_per_twin(legacy_twin, workloads)
+        column = bytes_per_twin(column_twin, workloads)
+        print(f"{size:>7} {legacy:>14.0f} {column:>14.0f} {1 - column / legacy:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+GitHub Cache - Conditional-request cache for GitHub API calls
+Stores ETag / Last-Modified per (URL, token identity). Fresh entries are
+served without touching the network; stale ones are revalidated with
+If-None-Match / If-Modified-Since, and GitHub does not count 304 replies
+against the rate limit. Also holds the per-repo language cache and the
+rate-limit budget used by deep verification
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import os
+import time
+
+import httpx
+
+from metrics import GITHUB_CACHE, observe_rate_limit, observe_upstream
+
+# Defaults, overridable through the environment
+GITHUB_CACHE_TTL = float(os.getenv("SKILL_TWIN_GITHUB_CACHE_TTL", "60"))
+GITHUB_CACHE_SIZE = int(os.getenv("SKILL_TWIN_GITHUB_CACHE_SIZE", "1024"))
+GITHUB_REPO_LANGUAGE_CACHE_SIZE = int(os.getenv("SKILL_TWIN_GITHUB_REPO_LANGUAGE_CACHE_SIZE", "20000"))
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("SKILL_TWIN_GITHUB_RATE_LIMIT_RESERVE", "5"))
+GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv("SKILL_TWIN_GITHUB_RATE_LIMIT_MAX_WAIT", "10"))
+
+
+class CachedResponse:
+    """The parts of an httpx.Response the connector reads, possibly from cache"""
+
+    __slots__ = ("status_code", "headers", "from_cache", "_data")
+
+    def __init__(self, status_code: int, data: Any, headers: httpx.Headers, from_cache: bool):
+        self.status_code = status_code
+        self.headers = headers
+        self.from_cache = from_cache
+        self._data = data
+
+    def json(self) -> Any:
+        return self._data
+
+
+class _Entry:
+    __slots__ = ("data", "headers", "etag", "last_modified", "fetched_at")
+
+    def __init__(self, data: Any, headers: httpx.Headers):
+        self.data = data
+        self.headers = headers
+        self.etag = headers.get("etag")
+        self.last_modified = headers.get("last-modified")
+        self.fetched_at = time.monotonic()
+
+
+def token_identity(headers: Dict[str, str]) -> str:
+    """Cache partition for the caller's credentials, without keeping the token"""
+    auth = headers.get("Authorization", "")
+    return hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else "anonymous"
+
+
+class GitHubResponseCache:
+    """Bounded LRU of successful GitHub GET responses"""
+
+    def __init__(self, ttl: float = GITHUB_CACHE_TTL, max_entries: int = GITHUB_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _store(self, key: tuple, entry: _Entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str],
+                  timeout: Optional[float] = None, endpoint: str = "other") -> CachedResponse:
+        """
+        GET `url`, answering from cache or revalidating where possible
+        `endpoint` names the API route in metrics (users, repos, languages)
+        """
+        key = (url, token_identity(headers))
+        entry: Optional[_Entry] = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry.fetched_at < self.ttl:
+                GITHUB_CACHE.labels("fresh").inc()
+                return CachedResponse(200, entry.data, entry.headers, from_cache=True)
+            headers = dict(headers)
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        started = time.perf_counter()
+        try:
+            resp = await client.get(url, headers=headers, timeout=timeout)
+        except httpx.HTTPError:
+            observe_upstream("github", endpoint, started, "error")
+            raise
+        observe_upstream("github", endpoint, started, resp.status_code)
+        observe_rate_limit(resp.headers)
+
+        if resp.status_code == 304 and entry is not None:
+            GITHUB_CACHE.labels("revalidated").inc()
+            entry.fetched_at = time.monotonic()
+            # Keep the fresh rate-limit headers alongside the cached body
+            merged = entry.headers.copy()
+            merged.update(resp.headers)
+            entry.headers = merged
+            return CachedResponse(200, entry.data, entry.headers, from_cache=True)
+
+        GITHUB_CACHE.labels("fetched").inc()
+        data = None
+        if resp.status_code == 200:
+            data = resp.json()
+            self._store(key, _Entry(data, resp.headers))
+        return CachedResponse(resp.status_code, data, resp.headers, from_cache=False)
+
+
+class RepoLanguageCache:
+    """
+    Per-repo language byte counts, valid while the repo's `pushed_at` is
+    unchanged, so re-verifying an account only refetches repos with new pushes
+    """
+
+    def __init__(self, max_entries: int = GITHUB_REPO_LANGUAGE_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, full_name: str, pushed_at: Optional[str]) -> Optional[Dict[str, int]]:
+        entry = self._entries.get(full_name)
+        if entry is None or entry[0] != pushed_at:
+            return None
+        self._entries.move_to_end(full_name)
+        return entry[1]
+
+    def put(self, full_name: str, pushed_at: Optional[str], languages: Dict[str, int]):
+        self._entries[full_name] = (pushed_at, languages)
+        self._entries.move_to_end(full_name)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RateLimitExhausted(Exception):
+    """Raised when the remaining GitHub budget would need too long a wait"""
+
+
+class RateLimitBudget:
+    """
+    Tracks X-RateLimit-Remaining / X-RateLimit-Reset across concurrent
+    requests and pauses callers until the window resets once the budget
+    runs down to `reserve`
+    """
+
+    def __init__(self, reserve: int = GITHUB_RATE_LIMIT_RESERVE, max_wait: float = GITHUB_RATE_LIMIT_MAX_WAIT):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+
+    async def acquire(self):
+        """Wait, if needed, before spending one request"""
+        if self.remaining is not None and self.remaining <= self.reserve:
+            delay = self.reset_at - time.time()
+            if delay > self.max_wait:
+                raise RateLimitExhausted()
+            if delay > 0:
+                await asyncio.sleep(delay + 0.5)
+                self.remaining = None
+        if self.remaining is not None:
+            self.remaining -= 1  # Optimistic, so concurrent callers see it
+
+    def observe(self, headers: httpx.Headers):
+        """Update the budget from a response's rate-limit headers"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is not None and remaining.isdigit():
+            self.remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.reset_at = float(reset)
+        # Secondary rate limits only say how long to back off
+        retry_after = headers.get("retry-after")
+        if retry_after is not None and retry_after.isdigit():
+            self.remaining = 0
+            self.reset_at = max(self.reset_at, time.time() + int(retry_after))
+
+
+def is_rate_limited(resp: httpx.Response) -> bool:
+    """A 403/429 that GitHub marks as a rate limit, not e.g. a private or blocked repo"""
+    return resp.status_code in (403, 429) and (
+        resp.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in resp.headers
+    )
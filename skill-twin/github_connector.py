@@ -4,8 +4,35 @@ Fetches repos, languages, and calculates velocity/consistency scores
 """
 
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import asyncio
+import os
+import re
+
+from http_pool import client_scope
+from github_cache import GitHubResponseCache, RepoLanguageCache, RateLimitBudget, RateLimitExhausted, is_rate_limited
+
+# GitHub REST API root; point it at a local fake server for testing
+GITHUB_API_URL = os.getenv("SKILL_TWIN_GITHUB_API_URL", "https://api.github.com")
+
+# Per-request timeout for api.github.com, in seconds
+GITHUB_TIMEOUT = float(os.getenv("SKILL_TWIN_GITHUB_TIMEOUT", "15"))
+
+# Repo pagination: parallel page fetches and a hard page cap (100 repos per page)
+GITHUB_PAGE_CONCURRENCY = int(os.getenv("SKILL_TWIN_GITHUB_PAGE_CONCURRENCY", "4"))
+GITHUB_MAX_REPO_PAGES = int(os.getenv("SKILL_TWIN_GITHUB_MAX_REPO_PAGES", "30"))
+
+# Deep verification: parallel /languages calls per account
+GITHUB_LANGUAGE_CONCURRENCY = int(os.getenv("SKILL_TWIN_GITHUB_LANGUAGE_CONCURRENCY", "8"))
+
+RECENT_REPOS_LIMIT = 10
+
+# ETag / Last-Modified cache shared by all GitHub calls
+github_cache = GitHubResponseCache()
+
+# Language byte counts per repo, reused until the repo is pushed to again
+repo_language_cache = RepoLanguageCache()
 
 # GitHub language to skill mapping
 LANGUAGE_SKILL_MAP = {
@@ -31,9 +58,191 @@ LANGUAGE_SKILL_MAP = {
 }
 
 
-async def fetch_github_data(username: str, token: Optional[str] = None) -> Dict[str, Any]:
+class RepoAccumulator:
+    """
+    Folds pages of the repo listing into the metrics as they arrive, in any
+    order, so the full repo list is never held at once
+    """
+
+    def __init__(self, collect_refs: bool = False):
+        self.total_stars = 0
+        self.total_forks = 0
+        self.languages: Dict[str, int] = {}
+        # page number -> first repos with activity on that page
+        self._recent: Dict[int, List[Dict]] = {}
+        # (full_name, pushed_at, primary language) per repo, for deep mode
+        self.collect_refs = collect_refs
+        self.refs: List[tuple] = []
+
+    def add_page(self, page: int, repos: List[Dict]):
+        recent = []
+        for repo in repos:
+            self.total_stars += repo.get("stargazers_count", 0)
+            self.total_forks += repo.get("forks_count", 0)
+            lang = repo.get("language")
+            if lang:
+                lang_lower = lang.lower()
+                self.languages[lang_lower] = self.languages.get(lang_lower, 0) + 1
+            if self.collect_refs and repo.get("full_name"):
+                self.refs.append((repo["full_name"], repo.get("pushed_at"), lang))
+            if repo.get("pushed_at") and len(recent) < RECENT_REPOS_LIMIT:
+                recent.append(repo)
+        self._recent[page] = recent
+
+    def recent_repos(self) -> List[Dict]:
+        """Most recently updated repos, in listing order"""
+        ordered = []
+        for page in sorted(self._recent):
+            ordered.extend(self._recent[page])
+            if len(ordered) >= RECENT_REPOS_LIMIT:
+                break
+        return ordered[:RECENT_REPOS_LIMIT]
+
+
+def parse_link_header(value: Optional[str]) -> Dict[str, str]:
+    """{rel: url} from a GitHub `Link` header"""
+    links = {}
+    for url, rel in re.findall(r'<([^>]+)>\s*;\s*rel="([^"]+)"', value or ""):
+        links[rel] = url
+    return links
+
+
+def _with_page(url: str, page: int) -> str:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query["page"] = str(page)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+async def _fetch_remaining_pages(client: httpx.AsyncClient, headers: Dict[str, str],
+                                 link_header: Optional[str], repos: RepoAccumulator):
+    """Fetch repo pages 2..N in parallel, folding each in as it completes"""
+    links = parse_link_header(link_header)
+
+    if "last" in links:
+        last_page = int(dict(parse_qsl(urlsplit(links["last"]).query)).get("page", 1))
+        last_page = min(last_page, GITHUB_MAX_REPO_PAGES)
+        semaphore = asyncio.Semaphore(GITHUB_PAGE_CONCURRENCY)
+
+        async def fetch_page(page: int):
+            async with semaphore:
+                resp = await github_cache.get(
+                    client, _with_page(links["last"], page), headers=headers, timeout=GITHUB_TIMEOUT,
+                    endpoint="repos"
+                )
+            return page, resp
+
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(2, last_page + 1)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page, resp = await next_page
+                if resp.status_code == 200:
+                    repos.add_page(page, resp.json())
+        finally:
+            # A failed page ends the loop; the others must not keep running unawaited
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return
+
+    # No page count advertised: follow `next` links one at a time
+    page = 1
+    while "next" in links and page < GITHUB_MAX_REPO_PAGES:
+        page += 1
+        resp = await github_cache.get(client, links["next"], headers=headers, timeout=GITHUB_TIMEOUT,
+                                      endpoint="repos")
+        if resp.status_code != 200:
+            break
+        repos.add_page(page, resp.json())
+        links = parse_link_header(resp.headers.get("link"))
+
+
+async def _fetch_repo_languages(client: httpx.AsyncClient, headers: Dict[str, str],
+                                refs: List[tuple], budget: RateLimitBudget) -> List[Optional[Dict[str, int]]]:
+    """
+    Byte counts per language for each repo, from cache when `pushed_at` is
+    unchanged. None for repos that could not be fetched
+    """
+    semaphore = asyncio.Semaphore(GITHUB_LANGUAGE_CONCURRENCY)
+    exhausted = False
+
+    async def fetch(full_name: str, pushed_at: Optional[str]) -> Optional[Dict[str, int]]:
+        nonlocal exhausted
+        cached = repo_language_cache.get(full_name, pushed_at)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            # One retry after a rate-limit reply, once the window has reset
+            for _ in range(2):
+                if exhausted:
+                    return None
+                try:
+                    await budget.acquire()
+                except RateLimitExhausted:
+                    exhausted = True
+                    return None
+                resp = await github_cache.get(
+                    client, f"{GITHUB_API_URL}/repos/{full_name}/languages",
+                    headers=headers, timeout=GITHUB_TIMEOUT, endpoint="languages"
+                )
+                budget.observe(resp.headers)
+                if resp.status_code == 200:
+                    repo_language_cache.put(full_name, pushed_at, resp.json())
+                    return resp.json()
+                if not is_rate_limited(resp):
+                    return None
+        return None
+
+    return await asyncio.gather(*(fetch(full_name, pushed_at) for full_name, pushed_at, _ in refs))
+
+
+def _byte_weighted_skills(refs: List[tuple], repo_languages: List[Optional[Dict[str, int]]]) -> tuple:
+    """
+    Aggregate per-repo byte counts into verified skills. Each repo counts
+    towards a language by that language's share of the repo's bytes; repos
+    whose languages could not be fetched count fully for their primary one
+    """
+    language_bytes: Dict[str, int] = {}
+    weighted_repos: Dict[str, float] = {}
+    repo_counts: Dict[str, int] = {}
+
+    for (_, _, primary), languages in zip(refs, repo_languages):
+        if not languages:
+            if primary:
+                languages = {primary: 0}
+            else:
+                continue
+        total = sum(languages.values())
+        for lang, size in languages.items():
+            lang_lower = lang.lower()
+            share = size / total if total else 1.0
+            language_bytes[lang_lower] = language_bytes.get(lang_lower, 0) + size
+            weighted_repos[lang_lower] = weighted_repos.get(lang_lower, 0.0) + share
+            repo_counts[lang_lower] = repo_counts.get(lang_lower, 0) + 1
+
+    all_bytes = sum(language_bytes.values())
+    verified_skills = {}
+    for lang, weighted in weighted_repos.items():
+        skill_name = LANGUAGE_SKILL_MAP.get(lang, lang)
+        # Same scale as repo counting, with repos weighted by byte share
+        skill_score = min(0.5 + (weighted * 0.3), 3.0)
+        verified_skills[skill_name] = {
+            "score": round(skill_score, 2),
+            "repo_count": repo_counts[lang],
+            "bytes": language_bytes[lang],
+            "weight": round(language_bytes[lang] / all_bytes, 3) if all_bytes else 0.0,
+            "verified": True
+        }
+    return language_bytes, verified_skills
+
+
+async def fetch_github_data(username: str, token: Optional[str] = None,
+                            client: Optional[httpx.AsyncClient] = None,
+                            deep: bool = False) -> Dict[str, Any]:
     """
     Fetch GitHub user data and analyze for skill verification
+    With `deep`, every repo's /languages breakdown is fetched and skills are
+    weighted by bytes of code instead of by primary language only
     
     Returns:
     - velocity_score: Based on repo count
@@ -48,12 +257,24 @@ async def fetch_github_data(username: str, token: Optional[str] = None) -> Dict[
     if token:
         headers["Authorization"] = f"token {token}"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_scope(client) as client:
         try:
-            # Fetch user profile
-            user_resp = await client.get(
-                f"https://api.github.com/users/{username}",
-                headers=headers
+            # Fetch user profile and the first repo page concurrently
+            user_resp, repos_resp = await asyncio.gather(
+                github_cache.get(
+                    client,
+                    f"{GITHUB_API_URL}/users/{username}",
+                    headers=headers,
+                    timeout=GITHUB_TIMEOUT,
+                    endpoint="users"
+                ),
+                github_cache.get(
+                    client,
+                    f"{GITHUB_API_URL}/users/{username}/repos?per_page=100&sort=updated",
+                    headers=headers,
+                    timeout=GITHUB_TIMEOUT,
+                    endpoint="repos"
+                )
             )
             
             if user_resp.status_code == 404:
@@ -63,17 +284,16 @@ async def fetch_github_data(username: str, token: Optional[str] = None) -> Dict[
             
             user_data = user_resp.json()
 
-            # Fetch repositories
-            repos_resp = await client.get(
-                f"https://api.github.com/users/{username}/repos?per_page=100&sort=updated",
-                headers=headers
-            )
-            repos_data = repos_resp.json() if repos_resp.status_code == 200 else []
+            # Fold in every repo page, fetching the rest in parallel
+            repos = RepoAccumulator(collect_refs=deep)
+            if repos_resp.status_code == 200:
+                repos.add_page(1, repos_resp.json())
+                await _fetch_remaining_pages(client, headers, repos_resp.headers.get("link"), repos)
 
             # Calculate metrics
             public_repos = user_data.get("public_repos", 0)
-            total_stars = sum(repo.get("stargazers_count", 0) for repo in repos_data)
-            total_forks = sum(repo.get("forks_count", 0) for repo in repos_data)
+            total_stars = repos.total_stars
+            total_forks = repos.total_forks
             
             # Velocity Score: Measures output volume (0-1)
             velocity_score = min(public_repos / 10.0, 1.0)
@@ -83,31 +303,30 @@ async def fetch_github_data(username: str, token: Optional[str] = None) -> Dict[
             fork_factor = min(total_forks / 3.0, 1.0)
             consistency_score = (star_factor + fork_factor) / 2
 
-            # Extract languages
-            languages = {}
-            for repo in repos_data:
-                lang = repo.get("language")
-                if lang:
-                    lang_lower = lang.lower()
-                    if lang_lower in languages:
-                        languages[lang_lower] += 1
-                    else:
-                        languages[lang_lower] = 1
+            # Languages across all repos
+            languages = repos.languages
 
             # Map languages to skills
             verified_skills = {}
-            for lang, count in languages.items():
-                skill_name = LANGUAGE_SKILL_MAP.get(lang, lang)
-                # Score based on repo count using this language
-                skill_score = min(0.5 + (count * 0.3), 3.0)  # Base 0.5, +0.3 per repo
-                verified_skills[skill_name] = {
-                    "score": round(skill_score, 2),
-                    "repo_count": count,
-                    "verified": True
-                }
+            language_bytes = None
+            if deep:
+                budget = RateLimitBudget()
+                budget.observe(user_resp.headers)
+                repo_languages = await _fetch_repo_languages(client, headers, repos.refs, budget)
+                language_bytes, verified_skills = _byte_weighted_skills(repos.refs, repo_languages)
+            else:
+                for lang, count in languages.items():
+                    skill_name = LANGUAGE_SKILL_MAP.get(lang, lang)
+                    # Score based on repo count using this language
+                    skill_score = min(0.5 + (count * 0.3), 3.0)  # Base 0.5, +0.3 per repo
+                    verified_skills[skill_name] = {
+                        "score": round(skill_score, 2),
+                        "repo_count": count,
+                        "verified": True
+                    }
 
             # Recent activity (repos updated in last 6 months)
-            recent_repos = [r for r in repos_data if r.get("pushed_at")][:10]
+            recent_repos = repos.recent_repos()
 
             return {
                 "success": True,
@@ -127,6 +346,7 @@ async def fetch_github_data(username: str, token: Optional[str] = None) -> Dict[
                     "total_forks": total_forks
                 },
                 "languages": languages,
+                "language_bytes": language_bytes,
                 "verified_skills": verified_skills,
                 "recent_repos": [
                     {
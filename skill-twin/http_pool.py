@@ -0,0 +1,45 @@
+"""
+HTTP Pool - Shared outbound HTTP client
+One app-lifetime httpx.AsyncClient so calls to the main backend and to
+api.github.com reuse kept-alive connections instead of handshaking per request.
+Each call site passes its own per-host timeout
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+import importlib.util
+import os
+
+import httpx
+
+# Defaults, overridable through the environment
+HTTP_MAX_CONNECTIONS = int(os.getenv("SKILL_TWIN_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("SKILL_TWIN_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("SKILL_TWIN_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("SKILL_TWIN_HTTP_TIMEOUT", "30"))
+
+# HTTP/2 needs the optional `h2` package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the pooled client; the caller owns it and must close it"""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=HTTP_DEFAULT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        )
+    )
+
+
+@asynccontextmanager
+async def client_scope(client: Optional[httpx.AsyncClient]) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the shared pooled client when given, else a short-lived one"""
+    if client is not None:
+        yield client
+        return
+    async with create_http_client() as own_client:
+        yield own_client
@@ -0,0 +1,169 @@
+"""
+Jobs - In-process background job queue
+Fixed pool of asyncio workers behind a bounded queue. Callers get a job ID
+back immediately and poll (or stream) its status; submitting work whose key
+matches a job still in flight returns that job instead of a new one
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import os
+import time
+import uuid
+
+# Defaults, overridable through the environment
+JOB_WORKERS = int(os.getenv("SKILL_TWIN_JOB_WORKERS", "4"))
+JOB_QUEUE_LIMIT = int(os.getenv("SKILL_TWIN_JOB_QUEUE_LIMIT", "100"))
+JOB_RETENTION = float(os.getenv("SKILL_TWIN_JOB_RETENTION", "600"))  # Seconds finished jobs stay pollable
+JOB_MAX_RETAINED = int(os.getenv("SKILL_TWIN_JOB_MAX_RETAINED", "1000"))
+
+
+class JobQueueFull(Exception):
+    """Raised when the queue already holds JOB_QUEUE_LIMIT waiting jobs"""
+
+
+class JobFailed(Exception):
+    """Raised by a job function to fail with a user-facing message"""
+
+
+class Job:
+    """One unit of background work and its observable status"""
+
+    def __init__(self, kind: str, key: Hashable, run: Callable[["Job"], Awaitable[Any]]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.run = run
+        self.context: Dict[str, Any] = {}
+        self.status = "queued"
+        self.stage = "queued"
+        self.progress = 0.0
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def _notify(self):
+        # Wake every waiter, then arm a fresh event for the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def set_progress(self, stage: str, progress: float):
+        """Report progress from inside the job function"""
+        self.stage = stage
+        self.progress = progress
+        self._notify()
+
+    def _finish(self, status: str, result: Any = None, error: Optional[str] = None):
+        self.status = status
+        self.stage = status
+        self.progress = 1.0
+        self.result = result
+        self.error = error
+        self.finished_at = time.time()
+        self._notify()
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Wait until the status changes; False on timeout"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobQueue:
+    """Bounded asyncio queue drained by a fixed set of worker tasks"""
+
+    def __init__(self, workers: int = JOB_WORKERS, queue_limit: int = JOB_QUEUE_LIMIT):
+        self.workers = max(1, workers)
+        self.queue_limit = max(1, queue_limit)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._inflight: Dict[Hashable, Job] = {}
+
+    async def start(self):
+        """Spawn the workers; call from the app's lifespan"""
+        self._queue = asyncio.Queue(maxsize=self.queue_limit)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _prune(self):
+        """Forget finished jobs past their retention, oldest first"""
+        now = time.time()
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            too_many = len(self._jobs) > JOB_MAX_RETAINED
+            expired = job.finished and now - job.finished_at > JOB_RETENTION
+            if not (too_many or expired):
+                break
+            if job.finished:
+                del self._jobs[job_id]
+
+    def submit(self, kind: str, key: Hashable, run: Callable[[Job], Awaitable[Any]]) -> Tuple[Job, bool]:
+        """
+        Queue `run(job)` unless a job with the same key is still in flight
+        Returns (job, created)
+        """
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return existing, False
+        if self._queue is None:
+            raise RuntimeError("JobQueue.start() has not been awaited")
+
+        job = Job(kind, key, run)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull()
+        self._prune()
+        self._jobs[job.id] = job
+        self._inflight[key] = job
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.set_progress("running", 0.0)
+            try:
+                job._finish("done", result=await job.run(job))
+            except asyncio.CancelledError:
+                job._finish("failed", error="Cancelled")
+                raise
+            except Exception as e:  # JobFailed or anything unexpected
+                job._finish("failed", error=str(e))
+            finally:
+                # Later submissions with this key start a fresh job
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+                self._queue.task_done()
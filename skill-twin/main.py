@@ -4,27 +4,96 @@ Main entry point serving API endpoints and static frontend
 Integrates with main Node.js backend for user data
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Header
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, UploadFile, File, HTTPException, Header, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from contextlib import asynccontextmanager
 import uvicorn
 import httpx
+import asyncio
+import json
+import math
 import os
+import time
 
-from twin_core import skill_twin
-from resume_parser import parse_resume
+from twin_core import SkillTwin
+from skill_history import RESOLUTIONS
+from twin_store import TwinStore, session_id_for_token
+from twin_persist import TwinPersistence
+from parse_pool import ParsePool, ParsePoolSaturated, ParseTimeout
+from resume_cache import ResumeCache, resume_cache_key
+from resume_parser import stream_resume
 from github_connector import fetch_github_data
+from github_cache import token_identity
+from jobs import JobQueue, JobQueueFull, JobFailed
+from http_pool import create_http_client, client_scope
+from single_flight import SingleFlight, ProfileCache
+from profile_sync import apply_profile
+from static_assets import StaticAssets
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from metrics import REGISTRY, MetricsMiddleware, RESUME_CACHE, RESUME_STAGE_SECONDS, observe_upstream
+from profiling import ADMIN_TOKEN, PROFILE_MAX_SECONDS, LoopLagMonitor, ProfilerBusy, SamplingProfiler, is_admin, render_collapsed
+from scenarios import SCENARIO_PATHS, SCENARIO_MAX_PATHS, SCENARIO_MAX_STEPS, SCENARIO_VELOCITY_NOISE
 
 # Main app backend URL
 MAIN_BACKEND_URL = "http://localhost:3000"
+MAIN_BACKEND_TIMEOUT = float(os.getenv("SKILL_TWIN_MAIN_BACKEND_TIMEOUT", "10"))
+
+# Shared outbound client, created in the lifespan hook
+http_client: httpx.AsyncClient | None = None
+
+# Process pool that keeps PDF parsing off the event loop
+parse_pool = ParsePool()
+
+# Parsed resumes keyed by upload hash + SKILL_DB version
+resume_cache = ResumeCache()
+
+# One twin per session, keyed by the caller's auth token; persisted when
+# SKILL_TWIN_STATE_DB is set
+twin_persistence = TwinPersistence()
+twin_store = TwinStore(persistence=twin_persistence)
+
+# Coalesces concurrent dashboard syncs; recent profiles skip the main backend
+sync_flight = SingleFlight()
+profile_cache = ProfileCache()
+
+# Background work (GitHub verification) polled via /api/jobs/{id}
+job_queue = JobQueue()
+
+# Frontend files, hashed and precompressed once at startup
+static_assets = StaticAssets("static")
+
+# Admin-only diagnostics: on-demand sampling, and logging of loop stalls
+profiler = SamplingProfiler()
+loop_lag_monitor = LoopLagMonitor()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start shared resources on startup and release them on shutdown"""
+    global http_client
+    parse_pool.start()
+    http_client = create_http_client()
+    await job_queue.start()
+    await twin_persistence.start()
+    await loop_lag_monitor.start()
+    yield
+    await loop_lag_monitor.stop()
+    await job_queue.stop()
+    await twin_persistence.stop()
+    await http_client.aclose()
+    http_client = None
+    parse_pool.shutdown()
+    resume_cache.close()
+
 
 # Initialize FastAPI
 app = FastAPI(
     title="Skill Twin API",
     description="Digital Twin for Skill Intelligence - Extension of Main App",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -36,14 +105,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency and in-flight requests, exposed at /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Request models
 class GitHubRequest(BaseModel):
     username: str
     token: str | None = None
+    deep: bool = False  # Weight skills by per-repo language bytes
 
 class SimulateRequest(BaseModel):
     months: int = 12
 
+class HorizonSimulateRequest(BaseModel):
+    horizons: list[int] | None = None  # Explicit months; otherwise start..end by step
+    start: int = 1
+    end: int = 120
+    step: int = 1
+    columnar: bool = False
+
+class ScenarioRequest(BaseModel):
+    months: int = 12
+    paths: int = SCENARIO_PATHS
+    seed: int = 0
+    velocity_noise: float = SCENARIO_VELOCITY_NOISE  # Fraction of each skill's velocity
+    boosts: dict[str, float] | None = None  # Study plan: extra score per month per skill
+    percentiles: list[float] = [10, 50, 90]
+
 class NameRequest(BaseModel):
     name: str
 
@@ -53,125 +141,211 @@ class SyncRequest(BaseModel):
 
 # API Endpoints
 
-@app.get("/")
-async def root():
+@app.api_route("/", methods=["GET", "HEAD"])
+async def root(request: Request):
     """Serve the main dashboard"""
-    return FileResponse("static/index.html")
+    return static_assets.response("index.html", request.headers, request.method)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+def require_admin(token: str | None):
+    """Admin endpoints are hidden unless SKILL_TWIN_ADMIN_TOKEN is set"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin(token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@app.post("/api/admin/profile")
+async def profile_process(
+    seconds: float = 10,
+    interval_ms: float | None = None,
+    format: str = "collapsed",
+    x_admin_token: str | None = Header(None)
+):
+    """
+    Sample every thread's stack for `seconds` and return collapsed stacks
+    (format=collapsed, for flamegraph.pl / speedscope) or JSON
+    """
+    require_admin(x_admin_token)
+    if format not in ("collapsed", "json"):
+        raise HTTPException(status_code=400, detail="Format must be collapsed or json")
+    if not (math.isfinite(seconds) and 0 < seconds <= PROFILE_MAX_SECONDS):
+        raise HTTPException(status_code=400, detail=f"Seconds must be greater than 0 and at most {PROFILE_MAX_SECONDS:g}")
+    if interval_ms is not None and not (math.isfinite(interval_ms) and 1 <= interval_ms <= 1000):
+        raise HTTPException(status_code=400, detail="interval_ms must be between 1 and 1000")
+    try:
+        result = await asyncio.to_thread(
+            profiler.sample, seconds, interval_ms / 1000 if interval_ms else None
+        )
+    except ProfilerBusy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    if format == "json":
+        return {"success": True, **result}
+    return PlainTextResponse(render_collapsed(result["stacks"]), headers={
+        "X-Profile-Samples": str(result["samples"]),
+        "X-Profile-Seconds": str(result["seconds"])
+    })
+
+
+@app.get("/api/admin/loop_lag")
+async def loop_lag(x_admin_token: str | None = Header(None)):
+    """Recent event-loop stalls with the route and stack that caused them"""
+    require_admin(x_admin_token)
+    return {
+        "success": True,
+        "threshold_ms": loop_lag_monitor.threshold * 1000,
+        "stalls": list(loop_lag_monitor.stalls)
+    }
+
+
+def observe_resume_timings(endpoint: str, timings: dict, elapsed: float | None = None):
+    """Per-stage parse time; `elapsed` is the caller's wall time, so the rest is queueing"""
+    RESUME_STAGE_SECONDS.labels(endpoint, "extract").observe(timings["extract"])
+    RESUME_STAGE_SECONDS.labels(endpoint, "match").observe(timings["match"])
+    if elapsed is not None:
+        RESUME_STAGE_SECONDS.labels(endpoint, "queue").observe(max(0.0, elapsed - timings["extract"] - timings["match"]))
+
+
+def session_id(authorization: str | None) -> str:
+    """Session ID from an `Authorization: Bearer <token>` header"""
+    token = None
+    if authorization and authorization.lower().startswith("bearer "):
+        token = authorization[7:].strip()
+    return session_id_for_token(token)
 
 
 @app.get("/api/state")
-async def get_state():
+async def get_state(authorization: str | None = Header(None)):
     """Get current twin state"""
+    skill_twin = await twin_store.get(session_id(authorization))
     return JSONResponse(content=skill_twin.get_state())
 
 
-@app.post("/api/sync_from_main_app")
-async def sync_from_main_app(request: SyncRequest):
+@app.get("/api/history")
+async def get_history(
+    skill: str | None = None,
+    start: float | None = None,
+    end: float | None = None,
+    resolution: str = "auto",
+    authorization: str | None = Header(None)
+):
     """
-    Sync data from the main Node.js backend
-    Fetches user profile, skills, and GitHub repos using auth token
+    Score history per skill between `start` and `end` (epoch seconds)
+    Resolution: auto (every tier), raw, daily or monthly
     """
-    token = request.token
-    if not token:
-        raise HTTPException(status_code=400, detail="Auth token required")
-    
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"Resolution must be one of {', '.join(RESOLUTIONS)}")
+    skill_twin = await twin_store.get(session_id(authorization))
+    history = skill_twin.get_history(skill, start, end, resolution)
+    return {"success": True, "resolution": resolution, "history": history}
+
+
+async def fetch_main_app_profile(token: str, sid: str) -> tuple[dict, bool]:
+    """
+    The applicant profile from the main backend, or from the short-TTL cache
+    Returns (profile, cached)
+    """
+    profile = profile_cache.get(sid)
+    if profile is not None:
+        return profile, True
+
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with client_scope(http_client) as client:
+        started = time.perf_counter()
         try:
             # Fetch profile from main app
             profile_resp = await client.get(
                 f"{MAIN_BACKEND_URL}/api/applicant/profile",
-                headers=headers
+                headers=headers,
+                timeout=MAIN_BACKEND_TIMEOUT
             )
-            
-            if profile_resp.status_code != 200:
-                raise HTTPException(status_code=401, detail="Failed to fetch profile. Check auth token.")
-            
-            profile_data = profile_resp.json()
-            
-            if not profile_data.get("success"):
-                raise HTTPException(status_code=400, detail="Profile not found. Create profile first.")
-            
-            profile = profile_data.get("data", {})
-            
-            # Reset twin and set name from profile
-            skill_twin.reset()
-            
-            # Get user name from profile or use "Applicant"
-            user_name = profile.get("user", {}).get("name", "Applicant")
-            skill_twin.set_name(user_name)
-            
-            # Extract skills from derived_skills
-            derived_skills = profile.get("derivedSkills", [])
-            for skill in derived_skills:
-                skill_twin.update_skill(
-                    name=skill.get("name", "unknown"),
-                    impact=skill.get("confidence", 0.5) * 10,  # Convert 0-1 to 0-10 scale
-                    source=skill.get("source", "main-app")
-                )
-            
-            # Extract skills from certificates
-            certificates = profile.get("certificates", [])
-            for cert in certificates:
-                # Add certificate as a meta-skill
-                cert_name = cert.get("name", "")
-                platform = cert.get("platform", "")
-                if cert_name:
-                    if cert_name:
-                        # Use first 2 words of cert name for better display
-                        short_name = " ".join(cert_name.split()[:2]).lower()
-                        skill_twin.update_skill(
-                            name=short_name,
-                            impact=3.0,  # Increased impact for certificates
-                            source="certificate"
-                        )
-            
-            # Extract languages from GitHub repos
-            github_repos = profile.get("githubRepos", [])
-            for repo in github_repos:
-                languages = repo.get("languages", [])
-                
-                # Handle dictionary (old legacy) or list (prisma String[])
-                if isinstance(languages, dict):
-                    for lang in languages.keys():
-                        skill_twin.update_skill(
-                            name=lang.lower(),
-                            impact=1.0,
-                            source="github"
-                        )
-                elif isinstance(languages, list):
-                    for lang in languages:
-                        if isinstance(lang, str):
-                            skill_twin.update_skill(
-                                name=lang.lower(),
-                                impact=1.0,
-                                source="github"
-                            )
-            
-            skill_twin.state["resume_uploaded"] = bool(profile.get("resume"))
-            skill_twin.state["github_connected"] = len(github_repos) > 0
-            
-            return {
-                "success": True,
-                "message": f"Synced data for {user_name}",
-                "synced": {
-                    "skills": len(derived_skills),
-                    "certificates": len(certificates),
-                    "github_repos": len(github_repos)
-                },
-                "twin_state": skill_twin.get_state()
-            }
-            
         except httpx.RequestError as e:
+            observe_upstream("main_backend", "/api/applicant/profile", started, "error")
             raise HTTPException(status_code=500, detail=f"Connection to main app failed: {str(e)}")
+        observe_upstream("main_backend", "/api/applicant/profile", started, profile_resp.status_code)
+    
+    if profile_resp.status_code != 200:
+        raise HTTPException(status_code=401, detail="Failed to fetch profile. Check auth token.")
+    
+    profile_data = profile_resp.json()
+    
+    if not profile_data.get("success"):
+        raise HTTPException(status_code=400, detail="Profile not found. Create profile first.")
+    
+    profile = profile_data.get("data", {})
+    profile_cache.put(sid, profile)
+    return profile, False
+
+
+async def run_sync(token: str, sid: str) -> dict:
+    """One fetch-and-apply of a session's twin from its main-app profile"""
+    profile, cached = await fetch_main_app_profile(token, sid)
+    
+    async with twin_store.acquire(sid) as skill_twin:
+        # Apply only what changed since the last sync
+        changes = apply_profile(skill_twin, profile)
+    
+        # Get user name from profile or use "Applicant"
+        user_name = profile.get("user", {}).get("name", "Applicant")
+        if skill_twin.state["name"] != user_name:
+            skill_twin.set_name(user_name)
+    
+        github_repos = profile.get("githubRepos", [])
+        skill_twin.state["resume_uploaded"] = bool(profile.get("resume"))
+        skill_twin.state["github_connected"] = len(github_repos) > 0
+    
+        return {
+            "success": True,
+            "message": f"Synced data for {user_name}",
+            "synced": {
+                "skills": len(profile.get("derivedSkills", [])),
+                "certificates": len(profile.get("certificates", [])),
+                "github_repos": len(github_repos)
+            },
+            "changes": changes,
+            "profile_cached": cached,
+            "twin_state": skill_twin.get_state()
+        }
+
+
+@app.post("/api/sync_from_main_app")
+async def sync_from_main_app(request: SyncRequest):
+    """
+    Sync data from the main Node.js backend
+    Fetches user profile, skills, and GitHub repos using auth token.
+    Concurrent syncs for the same token share one fetch and one rebuild
+    """
+    token = request.token
+    if not token:
+        raise HTTPException(status_code=400, detail="Auth token required")
+    
+    sid = session_id_for_token(token)
+    return await sync_flight.do(sid, lambda: run_sync(token, sid))
+
+
+def apply_resume_skills(skill_twin: SkillTwin, skills: dict):
+    """Replace the twin's skills with the ones extracted from a resume"""
+    # Skills the new resume shares with the old one keep their history
+    skill_twin.replace_skills(
+        (skill_name, skill_data["score"], "resume")
+        for skill_name, skill_data in skills.items()
+    )
+    
+    skill_twin.state["resume_uploaded"] = True
 
 
 @app.post("/api/upload_resume")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(file: UploadFile = File(...), authorization: str | None = Header(None)):
     """
     Upload and parse resume PDF
     Extracts skills and updates the twin
@@ -183,88 +357,227 @@ async def upload_resume(file: UploadFile = File(...)):
         # Read file content
         content = await file.read()
         
-        # Clear existing skills before processing new resume
-        skill_twin.clear_skills()
-        
-        # Parse resume
-        result = parse_resume(content)
+        # Reuse an earlier parse of the same bytes, else parse in the process pool
+        cache_key = resume_cache_key(content)
+        result = await resume_cache.get(cache_key)
+        cache_hit = result is not None
+        RESUME_CACHE.labels("/api/upload_resume", "hit" if cache_hit else "miss").inc()
+        if not cache_hit:
+            started = time.perf_counter()
+            try:
+                result = await parse_pool.parse(content)
+            except ParsePoolSaturated:
+                raise HTTPException(status_code=503, detail="Resume parser is busy, try again shortly")
+            except ParseTimeout:
+                raise HTTPException(status_code=504, detail="Resume parsing timed out")
+            if "timings" in result:
+                observe_resume_timings("/api/upload_resume", result["timings"], time.perf_counter() - started)
+            await resume_cache.put(cache_key, result)
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to parse resume"))
         
-        # Update twin with extracted skills
-        for skill_name, skill_data in result["skills"].items():
-            skill_twin.update_skill(
-                name=skill_name,
-                impact=skill_data["score"],
-                source="resume"
-            )
-        
-        skill_twin.state["resume_uploaded"] = True
-        
-        return {
-            "success": True,
-            "message": f"Extracted {result['total_found']} skills from {result['pages']} pages",
-            "skills_found": result["skills"],
-            "twin_state": skill_twin.get_state()
-        }
+        async with twin_store.acquire(session_id(authorization)) as skill_twin:
+            apply_resume_skills(skill_twin, result["skills"])
+            
+            return {
+                "success": True,
+                "message": f"Extracted {result['total_found']} skills from {result['pages']} pages",
+                "skills_found": result["skills"],
+                "cache_hit": cache_hit,
+                "twin_state": skill_twin.get_state()
+            }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/connect_github")
-async def connect_github(request: GitHubRequest):
+@app.post("/api/upload_resume/stream")
+async def upload_resume_stream(file: UploadFile = File(...), authorization: str | None = Header(None)):
     """
-    Connect GitHub account and verify skills
-    Adds velocity and consistency scores
+    Upload and parse resume PDF, streaming partial results as NDJSON
+    One {"type": "page"} line per page, then a final {"type": "done"} line
     """
-    try:
-        result = await fetch_github_data(request.username, request.token)
-        
-        if not result["success"]:
-            raise HTTPException(status_code=400, detail=result.get("error", "Failed to fetch GitHub data"))
-        
-        # Update twin name from GitHub profile
-        profile_name = result["profile"]["name"]
-        if profile_name:
-            skill_twin.set_name(profile_name)
-        
-        # Add verified skills from GitHub
-        for skill_name, skill_data in result["verified_skills"].items():
-            skill_twin.update_skill(
-                name=skill_name,
-                impact=skill_data["score"],
-                source="github"
-            )
-        
-        # Update global velocity and consistency
-        metrics = result["metrics"]
-        skill_twin.state["attributes"]["velocity"] = max(
-            skill_twin.state["attributes"]["velocity"],
-            metrics["velocity_score"]
-        )
-        skill_twin.state["attributes"]["consistency"] = max(
-            skill_twin.state["attributes"]["consistency"],
-            metrics["consistency_score"]
-        )
-        skill_twin.state["github_connected"] = True
-        
-        return {
-            "success": True,
-            "message": f"Connected as {profile_name}",
-            "github_data": result,
-            "twin_state": skill_twin.get_state()
-        }
+    if not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    
+    content = await file.read()
+    cache_key = resume_cache_key(content)
+    cached = await resume_cache.get(cache_key)
+    session = session_id(authorization)
+    RESUME_CACHE.labels("/api/upload_resume/stream", "miss" if cached is None else "hit").inc()
+    # Streamed parses share the pool's admission limit; checked again when the stream starts
+    if cached is None and parse_pool.saturated:
+        raise HTTPException(status_code=503, detail="Resume parser is busy, try again shortly")
+    
+    async def events():
+        skills = {}
+        pages = 0
+        if cached is not None:
+            skills = cached["skills"]
+            pages = cached["pages"]
+        else:
+            page_results = stream_resume(content)
+            timings = {"extract": 0.0, "match": 0.0}
+            text_length = 0
+            try:
+                async with parse_pool.thread_slot() as slot:
+                    while True:
+                        # Each page is extracted in a worker thread so the loop keeps serving
+                        page = await slot.run(next, page_results, None)
+                        if page is None:
+                            break
+                        skills = page["skills"]
+                        pages = page["pages"]
+                        text_length = page["text_length"]
+                        timings["extract"] += page["timings"]["extract"]
+                        timings["match"] += page["timings"]["match"]
+                        yield json.dumps({
+                            "type": "page",
+                            "page": page["page"],
+                            "pages": pages,
+                            "page_skills": page["page_skills"],
+                            "total_found": page["total_found"]
+                        }) + "\n"
+            except ParsePoolSaturated:
+                yield json.dumps({"type": "error", "error": "Resume parser is busy, try again shortly"}) + "\n"
+                return
+            except ParseTimeout:
+                yield json.dumps({"type": "error", "error": "Resume parsing timed out"}) + "\n"
+                return
+            except Exception as e:
+                yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+                return
+            observe_resume_timings("/api/upload_resume/stream", timings)
+            # Same shape as a pooled parse (minus raw_text), so either endpoint can reuse it
+            await resume_cache.put(cache_key, {
+                "success": True,
+                "skills": skills,
+                "total_found": len(skills),
+                "text_length": text_length,
+                "pages": pages,
+                "timings": timings
+            })
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        async with twin_store.acquire(session) as skill_twin:
+            apply_resume_skills(skill_twin, skills)
+            done = json.dumps({
+                "type": "done",
+                "success": True,
+                "message": f"Extracted {len(skills)} skills from {pages} pages",
+                "skills_found": skills,
+                "cache_hit": cached is not None,
+                "twin_state": skill_twin.get_state()
+            }) + "\n"
+        yield done
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+def apply_github_result(skill_twin: SkillTwin, result: dict):
+    """Fold a successful fetch_github_data result into a twin"""
+    # Update twin name from GitHub profile
+    profile_name = result["profile"]["name"]
+    if profile_name:
+        skill_twin.set_name(profile_name)
+
+    # Add verified skills from GitHub
+    skill_twin.update_skills(
+        (skill_name, skill_data["score"], "github")
+        for skill_name, skill_data in result["verified_skills"].items()
+    )
+
+    # Update global velocity and consistency
+    metrics = result["metrics"]
+    skill_twin.raise_attributes(metrics["velocity_score"], metrics["consistency_score"])
+    skill_twin.state["github_connected"] = True
+
+
+async def run_github_job(job):
+    """Job body for connect_github: fetch once, apply to every waiting session"""
+    ctx = job.context
+    job.set_progress("fetching", 0.1)
+    result = await fetch_github_data(ctx["username"], ctx["token"], client=http_client, deep=ctx["deep"])
+    if not result["success"]:
+        raise JobFailed(result.get("error", "Failed to fetch GitHub data"))
+
+    job.set_progress("applying", 0.9)
+    applied = set()
+    # Sessions may join while we await a twin lock; loop until none are left
+    while pending := ctx["sessions"] - applied:
+        for sid in pending:
+            async with twin_store.acquire(sid) as skill_twin:
+                apply_github_result(skill_twin, result)
+        applied |= pending
+
+    return {
+        "message": f"Connected as {result['profile']['name']}",
+        "verified_skills": result["verified_skills"],
+        "metrics": result["metrics"],
+        "github_data": result
+    }
+
+
+@app.post("/api/connect_github", status_code=202)
+async def connect_github(request: GitHubRequest, authorization: str | None = Header(None)):
+    """
+    Connect GitHub account and verify skills in the background
+    Returns a job ID to poll at /api/jobs/{job_id}; a request matching a
+    verification already in flight joins that job
+    """
+    credentials = {"Authorization": f"token {request.token}"} if request.token else {}
+    key = ("github", request.username.lower(), token_identity(credentials), request.deep)
+    try:
+        job, created = job_queue.submit("github", key, run_github_job)
+    except JobQueueFull:
+        raise HTTPException(status_code=503, detail="Too many verifications queued, retry shortly")
+
+    if created:
+        job.context.update(username=request.username, token=request.token, deep=request.deep, sessions=set())
+    # Sessions joining before the apply stage get the result too
+    job.context["sessions"].add(session_id(authorization))
+
+    return {
+        "success": True,
+        "job_id": job.id,
+        "status": job.status,
+        "coalesced": not created
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status, progress and (once done) result of a background job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-sent events: a job snapshot on every change until it finishes"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        while True:
+            snapshot = job.to_dict()
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            if job.finished:
+                return
+            # Skip the wait if the job moved on while the event was being sent
+            while job.to_dict() == snapshot and not await job.wait_for_change(15):
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @app.post("/api/simulate")
-async def simulate_future(request: SimulateRequest):
+async def simulate_future(request: SimulateRequest, authorization: str | None = Header(None)):
     """
     Simulate future skill growth
     Returns predicted state after N months
@@ -272,6 +585,7 @@ async def simulate_future(request: SimulateRequest):
     if request.months < 1 or request.months > 120:
         raise HTTPException(status_code=400, detail="Months must be between 1 and 120")
     
+    skill_twin = await twin_store.get(session_id(authorization))
     simulation = skill_twin.simulate_future(request.months)
     
     return {
@@ -281,30 +595,96 @@ async def simulate_future(request: SimulateRequest):
     }
 
 
-@app.post("/api/reset")
-async def reset_twin():
-    """Reset the twin to blank state"""
-    skill_twin.reset()
+@app.post("/api/simulate/horizons")
+async def simulate_horizons(request: HorizonSimulateRequest, authorization: str | None = Header(None)):
+    """
+    Simulate future skill growth for many horizons in one call
+    Returns a skills x horizons projection for the frontend chart
+    """
+    if request.horizons is not None:
+        horizons = request.horizons
+    else:
+        if request.step < 1:
+            raise HTTPException(status_code=400, detail="Step must be at least 1")
+        # A range knows its length, so oversized spans are rejected before anything is built
+        horizons = range(request.start, request.end + 1, request.step)
+    
+    if not horizons or len(horizons) > 120:
+        raise HTTPException(status_code=400, detail="Between 1 and 120 horizons are allowed")
+    if any(months < 1 or months > 120 for months in horizons):
+        raise HTTPException(status_code=400, detail="Months must be between 1 and 120")
+    
+    skill_twin = await twin_store.get(session_id(authorization))
+    
     return {
         "success": True,
-        "message": "Twin reset to initial state",
-        "twin_state": skill_twin.get_state()
+        "simulation": skill_twin.simulate_horizons(list(horizons), columnar=request.columnar)
     }
 
 
-@app.post("/api/set_name")
-async def set_name(request: NameRequest):
-    """Set the twin's name"""
-    skill_twin.set_name(request.name)
+@app.post("/api/simulate/scenarios")
+async def simulate_scenarios(request: ScenarioRequest, authorization: str | None = Header(None)):
+    """
+    Monte Carlo growth scenarios
+    Returns p10/p50/p90 (or the requested percentiles) per skill for every month
+    """
+    if request.months < 1 or request.months > 120:
+        raise HTTPException(status_code=400, detail="Months must be between 1 and 120")
+    if request.paths < 100 or request.paths > SCENARIO_MAX_PATHS:
+        raise HTTPException(status_code=400, detail=f"Paths must be between 100 and {SCENARIO_MAX_PATHS}")
+    if request.seed < 0:
+        raise HTTPException(status_code=400, detail="Seed must be a non-negative integer")
+    # Written as "not within" so NaN, which fails every comparison, is rejected too
+    if not 0 <= request.velocity_noise <= 5:
+        raise HTTPException(status_code=400, detail="Velocity noise must be between 0 and 5")
+    if not request.percentiles or len(request.percentiles) > 9 or not all(0 <= p <= 100 for p in request.percentiles):
+        raise HTTPException(status_code=400, detail="Between 1 and 9 percentiles in 0..100 are allowed")
+    boosts = request.boosts or {}
+    if len(boosts) > 50 or not all(abs(boost) <= 10 for boost in boosts.values()):
+        raise HTTPException(status_code=400, detail="At most 50 boosts of at most 10 points per month")
+    
+    skill_twin = await twin_store.get(session_id(authorization))
+    skills = len(skill_twin.get_skill_names()) + len(boosts)  # Boosts may add skills
+    if request.paths * request.months * skills > SCENARIO_MAX_STEPS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Paths x months x skills must stay within {SCENARIO_MAX_STEPS}; lower paths or months"
+        )
+    
     return {
         "success": True,
-        "message": f"Name set to {request.name}",
-        "twin_state": skill_twin.get_state()
+        "simulation": skill_twin.simulate_scenarios(
+            request.months, request.paths, request.seed, request.velocity_noise, boosts, request.percentiles
+        )
     }
 
 
+@app.post("/api/reset")
+async def reset_twin(authorization: str | None = Header(None)):
+    """Reset the twin to blank state"""
+    async with twin_store.acquire(session_id(authorization)) as skill_twin:
+        skill_twin.reset()
+        return {
+            "success": True,
+            "message": "Twin reset to initial state",
+            "twin_state": skill_twin.get_state()
+        }
+
+
+@app.post("/api/set_name")
+async def set_name(request: NameRequest, authorization: str | None = Header(None)):
+    """Set the twin's name"""
+    async with twin_store.acquire(session_id(authorization)) as skill_twin:
+        skill_twin.set_name(request.name)
+        return {
+            "success": True,
+            "message": f"Name set to {request.name}",
+            "twin_state": skill_twin.get_state()
+        }
+
+
 # Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", static_assets, name="static")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,165 @@
+"""
+Metrics - Prometheus counters, gauges and histograms
+Metric families live in one prometheus_client registry rendered at
+/metrics. Also holds the ASGI middleware that times every request by route
+template, and the helpers other modules use to record outbound calls
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+import time
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+# Seconds; covers cached API hits through slow PDF parses and upstream calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Skill updates per request
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500)
+
+# This app's metrics only, without the library's process and platform collectors
+REGISTRY = CollectorRegistry()
+
+HTTP_REQUESTS = Counter(
+    "skill_twin_http_requests", "HTTP requests by route template and status", ("method", "route", "status"),
+    registry=REGISTRY
+)
+HTTP_DURATION = Histogram(
+    "skill_twin_http_request_duration_seconds", "Time to the end of the response body", ("method", "route"),
+    buckets=DEFAULT_BUCKETS, registry=REGISTRY
+)
+HTTP_IN_FLIGHT = Gauge(
+    "skill_twin_http_requests_in_flight", "Requests currently being served", registry=REGISTRY
+)
+RESUME_STAGE_SECONDS = Histogram(
+    "skill_twin_resume_stage_seconds", "Resume parsing time by stage (extract, match)", ("endpoint", "stage"),
+    buckets=DEFAULT_BUCKETS, registry=REGISTRY
+)
+RESUME_CACHE = Counter(
+    "skill_twin_resume_cache", "Resume uploads answered from the parse cache or parsed", ("endpoint", "result"),
+    registry=REGISTRY
+)
+UPSTREAM_DURATION = Histogram(
+    "skill_twin_upstream_request_duration_seconds", "Outbound call latency", ("upstream", "endpoint"),
+    buckets=DEFAULT_BUCKETS, registry=REGISTRY
+)
+UPSTREAM_REQUESTS = Counter(
+    "skill_twin_upstream_requests", "Outbound calls by response status, or 'error'", ("upstream", "endpoint", "status"),
+    registry=REGISTRY
+)
+GITHUB_CACHE = Counter(
+    "skill_twin_github_cache", "GitHub GETs served fresh from cache, revalidated (304) or fetched", ("result",),
+    registry=REGISTRY
+)
+# Registered on the first GitHub response, so they are absent rather than 0 until then
+GITHUB_RATELIMIT_REMAINING = Gauge(
+    "skill_twin_github_ratelimit_remaining", "X-RateLimit-Remaining on the latest GitHub response", registry=None
+)
+GITHUB_RATELIMIT_RESET = Gauge(
+    "skill_twin_github_ratelimit_reset_timestamp_seconds", "X-RateLimit-Reset on the latest GitHub response",
+    registry=None
+)
+SKILL_UPDATES = Histogram(
+    "skill_twin_skill_updates_per_request", "update_skill calls per request that held a twin", ("route",),
+    buckets=COUNT_BUCKETS, registry=REGISTRY
+)
+
+# Label for work done outside any request (background jobs)
+BACKGROUND_ROUTE = "background"
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_label(scope: dict) -> str:
+    """Route template (not the raw path, which would explode cardinality)"""
+    path = getattr(scope.get("route"), "path", None)
+    if path:
+        return path
+    # Mounted apps are not recorded as the route; their mount point is the root_path suffix
+    if scope.get("endpoint") is not None:
+        mount = scope.get("root_path", "")[len(scope.get("app_root_path", "")):]
+        if mount:
+            return mount
+    return UNMATCHED_ROUTE
+
+
+def observe_upstream(upstream: str, endpoint: str, started: float, status):
+    """Record one outbound call that began at perf_counter() `started`"""
+    UPSTREAM_DURATION.labels(upstream, endpoint).observe(time.perf_counter() - started)
+    UPSTREAM_REQUESTS.labels(upstream, endpoint, str(status)).inc()
+
+
+_rate_limit_registered = False
+
+
+def observe_rate_limit(headers):
+    """Track GitHub rate-limit headroom from a response's headers"""
+    global _rate_limit_registered
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if not _rate_limit_registered and (remaining is not None or reset is not None):
+        REGISTRY.register(GITHUB_RATELIMIT_REMAINING)
+        REGISTRY.register(GITHUB_RATELIMIT_RESET)
+        _rate_limit_registered = True
+    if remaining is not None and remaining.isdigit():
+        GITHUB_RATELIMIT_REMAINING.set(int(remaining))
+    if reset is not None and reset.isdigit():
+        GITHUB_RATELIMIT_RESET.set(int(reset))
+
+
+class SkillUpdateTally:
+    """update_skill calls made under one request, reported when it ends"""
+
+    __slots__ = ("count", "touched")
+
+    def __init__(self):
+        self.count = 0
+        self.touched = False
+
+
+_current_tally: ContextVar[Optional[SkillUpdateTally]] = ContextVar("metrics_skill_updates", default=None)
+
+
+def record_skill_updates(count: int):
+    """Add a twin's update_skill calls to the current request, or report them directly from background work"""
+    tally = _current_tally.get()
+    if tally is None:
+        SKILL_UPDATES.labels(BACKGROUND_ROUTE).observe(count)
+    else:
+        tally.count += count
+        tally.touched = True
+
+
+class MetricsMiddleware:
+    """ASGI middleware: per-route latency and status counts, and requests in flight"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        tally = SkillUpdateTally()
+        tally_token = _current_tally.set(tally)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            _current_tally.reset(tally_token)
+            route = route_label(scope)
+            method = scope["method"]
+            HTTP_DURATION.labels(method, route).observe(elapsed)
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            if tally.touched:
+                SKILL_UPDATES.labels(route).observe(tally.count)
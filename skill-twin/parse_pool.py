@@ -0,0 +1,189 @@
+"""
+Parse Pool - Off-loop resume parsing
+Runs the CPU-bound pypdf extraction in a bounded process pool so the
+event loop keeps serving other requests while PDFs are decoded. Streamed
+parses, which run page by page in threads, are admitted against the same
+limits through ThreadSlot
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import os
+import signal
+
+from resume_parser import parse_resume
+
+# Defaults, overridable through the environment
+PARSE_WORKERS = int(os.getenv("SKILL_TWIN_PARSE_WORKERS", str(os.cpu_count() or 2)))
+PARSE_QUEUE_LIMIT = int(os.getenv("SKILL_TWIN_PARSE_QUEUE_LIMIT", "16"))
+PARSE_TIMEOUT = float(os.getenv("SKILL_TWIN_PARSE_TIMEOUT", "30"))
+
+
+class ParsePoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class ParseTimeout(Exception):
+    """Raised when a single parse job runs longer than its timeout"""
+
+
+# Set by the SIGALRM handler in a worker; parse_resume swallows exceptions,
+# so the flag is what tells a timeout apart from a broken PDF
+_deadline_hit = False
+
+
+def _alarm_handler(signum, frame):
+    global _deadline_hit
+    _deadline_hit = True
+    raise ParseTimeout()
+
+
+def _parse_with_deadline(content: bytes, timeout: float) -> Dict[str, Any]:
+    """
+    Worker-side entry point. SIGALRM interrupts a runaway PDF inside the
+    worker, so a timed-out job frees its process instead of holding it
+    """
+    global _deadline_hit
+    _deadline_hit = False
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _alarm_handler)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        result = parse_resume(content)
+    except ParseTimeout:
+        result = {}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    if _deadline_hit:
+        return {"success": False, "error": "timeout", "skills": {}, "timed_out": True}
+    return result
+
+
+class ParsePool:
+    """
+    Bounded ProcessPoolExecutor stage in front of parse_resume.
+    At most `workers` jobs run at once and at most `queue_limit` more wait;
+    anything beyond that is rejected with ParsePoolSaturated.
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS, queue_limit: int = PARSE_QUEUE_LIMIT,
+                 timeout: float = PARSE_TIMEOUT):
+        self.workers = max(1, workers)
+        self.queue_limit = max(0, queue_limit)
+        self.timeout = timeout
+        self.in_flight = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # At most `workers` streamed parses run at once, like the processes
+        self._thread_slots = asyncio.Semaphore(self.workers)
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.workers + self.queue_limit
+
+    def thread_slot(self) -> "ThreadSlot":
+        """Admission for a parse run in this process's threads; raises ParsePoolSaturated"""
+        if self.saturated:
+            raise ParsePoolSaturated()
+        self.in_flight += 1
+        return ThreadSlot(self)
+
+    def start(self):
+        """Spawn the worker processes"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def shutdown(self):
+        """Stop the worker processes, dropping jobs that have not started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def parse(self, content: bytes) -> Dict[str, Any]:
+        """Parse a resume in a worker process; same result shape as parse_resume"""
+        if self.saturated:
+            raise ParsePoolSaturated()
+
+        self.start()
+        executor = self._executor
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                future = loop.run_in_executor(executor, _parse_with_deadline, content, self.timeout)
+            except BrokenProcessPool:
+                # Broke before this job was submitted (a worker died while idle): not
+                # this file's fault, so start a new executor and submit it there
+                self.shutdown()
+                self.start()
+                executor = self._executor
+                future = loop.run_in_executor(executor, _parse_with_deadline, content, self.timeout)
+            # The worker deadline only starts once a worker picks the job up,
+            # so the caller-side guard also allows for the jobs queued ahead
+            waves_ahead = (self.in_flight - 1) // self.workers
+            max_wait = self.timeout * (waves_ahead + 1) + 1
+            try:
+                result = await asyncio.wait_for(future, max_wait)
+            except asyncio.TimeoutError:
+                raise ParseTimeout()
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory on a hostile PDF) and the
+                # executor refuses all further work; the next parse starts a new one
+                if self._executor is executor:
+                    self.shutdown()
+                return {"success": False, "error": "Resume parser crashed on this file", "skills": {}}
+        finally:
+            self.in_flight -= 1
+
+        if result.get("timed_out"):
+            raise ParseTimeout()
+        return result
+
+
+class ThreadSlot:
+    """
+    One admitted threaded parse. Steps run under a per-worker semaphore and
+    a shared deadline of `timeout` seconds from when the slot is entered. A
+    thread cannot be interrupted, so a step that times out or is abandoned
+    keeps the slot until it actually returns
+    """
+
+    def __init__(self, pool: ParsePool):
+        self._pool = pool
+        self._running: Optional[asyncio.Future] = None
+        self._deadline = 0.0
+
+    async def __aenter__(self) -> "ThreadSlot":
+        try:
+            await self._pool._thread_slots.acquire()
+        except BaseException:
+            self._pool.in_flight -= 1
+            raise
+        self._deadline = asyncio.get_running_loop().time() + self._pool.timeout
+        return self
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """fn(*args) in a worker thread; raises ParseTimeout once the deadline passes"""
+        self._running = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        remaining = self._deadline - asyncio.get_running_loop().time()
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._running), max(0.0, remaining))
+        except asyncio.TimeoutError:
+            raise ParseTimeout()
+
+    async def __aexit__(self, *exc_info):
+        running = self._running
+        if running is not None and not running.done():
+            running.add_done_callback(self._release)
+        else:
+            self._release()
+
+    def _release(self, finished: Optional[asyncio.Future] = None):
+        if finished is not None and not finished.cancelled():
+            finished.exception()  # Retrieved, since nobody awaits an abandoned step
+        self._pool._thread_slots.release()
+        self._pool.in_flight -= 1
@@ -0,0 +1,120 @@
+"""
+Profile Sync - Incremental twin updates from main-app profiles
+Each profile record (derived skill, certificate, GitHub repo) is keyed by its
+ID and its addedAt / uploadedAt / fetchedAt stamp. The twin remembers the
+records it was last synced from, so a new sync only applies the
+contributions of records that appeared, changed or disappeared
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from twin_core import SkillTwin
+
+Contribution = Tuple[str, float, str]  # (skill name, impact, source)
+
+
+def _record_key(kind: str, record: Dict[str, Any], stamp_field: str, fallback: str) -> tuple:
+    return (kind, record.get("id") or fallback, record.get(stamp_field))
+
+
+def profile_records(profile: Dict[str, Any]) -> Dict[tuple, Tuple[Contribution, ...]]:
+    """Map each profile record to the skill contributions it makes"""
+    records: Dict[tuple, Tuple[Contribution, ...]] = {}
+
+    def add(key: tuple, contributions: List[Contribution]):
+        if contributions:
+            # Records without IDs can collide; keep everything they contribute
+            records[key] = records.get(key, ()) + tuple(contributions)
+
+    # Extract skills from derived_skills
+    for skill in profile.get("derivedSkills", []):
+        name = skill.get("name", "unknown")
+        add(_record_key("skill", skill, "addedAt", name), [(
+            name,
+            skill.get("confidence", 0.5) * 10,  # Convert 0-1 to 0-10 scale
+            skill.get("source", "main-app")
+        )])
+
+    # Extract skills from certificates
+    for cert in profile.get("certificates", []):
+        # Add certificate as a meta-skill
+        cert_name = cert.get("name", "")
+        if cert_name:
+            # Use first 2 words of cert name for better display
+            short_name = " ".join(cert_name.split()[:2]).lower()
+            add(_record_key("certificate", cert, "uploadedAt", cert_name), [(
+                short_name,
+                3.0,  # Increased impact for certificates
+                "certificate"
+            )])
+
+    # Extract languages from GitHub repos
+    for repo in profile.get("githubRepos", []):
+        languages = repo.get("languages", [])
+
+        # Handle dictionary (old legacy) or list (prisma String[])
+        if isinstance(languages, dict):
+            languages = list(languages.keys())
+        elif not isinstance(languages, list):
+            languages = []
+        add(
+            _record_key("repo", repo, "fetchedAt", repo.get("repoName", "")),
+            [(lang.lower(), 1.0, "github") for lang in languages if isinstance(lang, str)]
+        )
+
+    return records
+
+
+def diff_records(old: Dict[tuple, tuple], new: Dict[tuple, tuple]) -> Tuple[List[Contribution], List[Contribution]]:
+    """Contributions to add and to retract to go from `old` to `new`"""
+    added: List[Contribution] = []
+    removed: List[Contribution] = []
+    for key, contributions in new.items():
+        previous = old.get(key)
+        if previous != contributions:
+            added.extend(contributions)
+            if previous is not None:
+                removed.extend(previous)
+    for key, contributions in old.items():
+        if key not in new:
+            removed.extend(contributions)
+    return added, removed
+
+
+def apply_profile(skill_twin: SkillTwin, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bring a twin in line with a main-app profile
+    The first sync (or one after the skills were cleared) rebuilds the
+    skills from scratch, keeping the history of those that stay; later
+    ones net the diff per skill, so an unchanged profile touches nothing
+    and velocities reflect what actually changed
+    """
+    records = profile_records(profile)
+    previous = skill_twin.sync_records
+
+    if previous is None:
+        added = [c for contributions in records.values() for c in contributions]
+        skill_twin.replace_skills(added)
+        changes = {"full_rebuild": True, "added": len(added), "removed": 0}
+    else:
+        added, removed = diff_records(previous, records)
+        deltas: Dict[str, float] = defaultdict(float)
+        sources: Dict[str, str] = {}
+        for name, impact, source in added:
+            key = name.lower().strip()
+            deltas[key] += impact
+            sources[key] = source
+        for name, impact, _ in removed:
+            deltas[name.lower().strip()] -= impact
+
+        raises = [(name, delta, sources[name]) for name, delta in deltas.items() if delta > 1e-9]
+        retractions = [(name, -delta) for name, delta in deltas.items() if delta < -1e-9]
+        if raises:
+            skill_twin.update_skills(raises)
+        if retractions:
+            skill_twin.retract_skills(retractions)
+        changes = {"full_rebuild": False, "added": len(added), "removed": len(removed)}
+
+    skill_twin.sync_records = records
+    return changes
@@ -0,0 +1,227 @@
+"""
+Profiling - On-demand sampling profiler and event-loop lag monitor
+The profiler is a thread that snapshots every other thread's Python stack
+at a fixed interval for a bounded time and folds the samples into
+collapsed stacks ("a;b;c 42" lines) that flamegraph.pl, speedscope and
+inferno read directly. Resume parses in the process pool run in other
+processes and are not sampled; streamed parses run in threads and are.
+The lag monitor pairs a heartbeat on the loop with a watchdog thread: when
+the heartbeat stalls past the threshold, the watchdog captures the loop
+thread's stack while it is still blocked and logs it with the route being
+served
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+import asyncio
+import hmac
+import logging
+import math
+import os
+import sys
+import threading
+import time
+
+from prometheus_client import Counter, Histogram
+
+from metrics import REGISTRY, route_label
+
+# Defaults, overridable through the environment
+ADMIN_TOKEN = os.getenv("SKILL_TWIN_ADMIN_TOKEN")  # unset = admin endpoints disabled
+PROFILE_MAX_SECONDS = float(os.getenv("SKILL_TWIN_PROFILE_MAX_SECONDS", "60"))
+PROFILE_INTERVAL = float(os.getenv("SKILL_TWIN_PROFILE_INTERVAL_MS", "5")) / 1000
+LOOP_LAG_THRESHOLD = float(os.getenv("SKILL_TWIN_LOOP_LAG_THRESHOLD_MS", "100")) / 1000  # 0 = off
+
+# Stalls kept for /api/admin/loop_lag
+LOOP_LAG_HISTORY = 50
+# Frames kept per stack, innermost last
+MAX_STACK_DEPTH = 64
+
+logger = logging.getLogger("skill_twin.loop_lag")
+
+LOOP_LAG = Histogram(
+    "skill_twin_event_loop_lag_seconds", "Heartbeat delay beyond its scheduled wake-up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0), registry=REGISTRY
+)
+LOOP_STALLS = Counter(
+    "skill_twin_event_loop_stalls", "Loop blocked longer than the lag threshold", ("route",), registry=REGISTRY
+)
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is requested while another one is running"""
+
+
+def is_admin(token: Optional[str]) -> bool:
+    """Constant-time check against SKILL_TWIN_ADMIN_TOKEN; always False when it is unset"""
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def collapse_stack(frame) -> List[str]:
+    """Frame names from the outermost caller to `frame`"""
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+def find_scope(frame) -> Optional[dict]:
+    """The ASGI scope of the request a stack is serving, from the outermost app frame holding one"""
+    scope = None
+    while frame is not None:
+        candidate = frame.f_locals.get("scope") if "scope" in frame.f_code.co_varnames else None
+        if isinstance(candidate, dict) and candidate.get("type") == "http":
+            scope = candidate
+        frame = frame.f_back
+    return scope
+
+
+class SamplingProfiler:
+    """One bounded sampling run at a time, across every thread but its own"""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL, max_seconds: float = PROFILE_MAX_SECONDS):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def sample(self, seconds: float, interval: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Sample for `seconds` (capped at max_seconds), blocking the caller
+        Returns {"samples", "seconds", "interval", "stacks": {collapsed: count}}
+        """
+        if not math.isfinite(seconds) or (interval is not None and not math.isfinite(interval)):
+            raise ValueError("Profile duration and interval must be finite")
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy()
+        try:
+            interval = max(0.001, interval or self.interval)
+            seconds = min(max(seconds, interval), self.max_seconds)
+            own = threading.get_ident()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            stacks: Dict[str, int] = {}
+            samples = 0
+            started = time.monotonic()
+            deadline = started + seconds
+            next_at = started
+            while True:
+                for ident, frame in sys._current_frames().items():
+                    if ident == own:
+                        continue
+                    if ident not in names:
+                        names = {thread.ident: thread.name for thread in threading.enumerate()}
+                    key = ";".join([names.get(ident, str(ident))] + collapse_stack(frame))
+                    stacks[key] = stacks.get(key, 0) + 1
+                samples += 1
+                # Fixed schedule, so slow snapshots do not stretch the interval
+                next_at += interval
+                now = time.monotonic()
+                if next_at >= deadline:
+                    break
+                if next_at > now:
+                    time.sleep(next_at - now)
+            return {
+                "samples": samples,
+                "seconds": round(time.monotonic() - started, 3),
+                "interval": interval,
+                "stacks": stacks
+            }
+        finally:
+            self._lock.release()
+
+
+def render_collapsed(stacks: Dict[str, int]) -> str:
+    """Collapsed-stack text, heaviest stacks first"""
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items(), key=lambda s: -s[1]))
+
+
+class LoopLagMonitor:
+    """
+    Heartbeat task plus watchdog thread. Every stall past `threshold` is
+    logged once, while the loop is still blocked, with the loop thread's
+    stack and the route; its full length is logged when the loop recovers
+    """
+
+    def __init__(self, threshold: float = LOOP_LAG_THRESHOLD, history: int = LOOP_LAG_HISTORY):
+        self.threshold = threshold
+        self.interval = threshold / 4
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._beat = 0.0
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stall: Optional[Dict[str, Any]] = None  # the stall in progress, set by the watchdog
+
+    async def start(self):
+        """Start monitoring the running loop; no-op when the threshold is 0"""
+        if self.threshold <= 0 or self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await asyncio.to_thread(self._watchdog.join)
+        self._watchdog = None
+
+    async def _heartbeat(self):
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - self._beat - self.interval)
+            LOOP_LAG.observe(lag)
+            stall = self._stall
+            if stall is not None:
+                self._stall = None
+                stall["blocked_ms"] = round(lag * 1000, 1)
+                logger.warning("Event loop was blocked for %.0f ms serving %s", stall["blocked_ms"], stall["route"])
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            blocked = time.monotonic() - self._beat - self.interval
+            if blocked < self.threshold or self._stall is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            scope = find_scope(frame)
+            route = route_label(scope) if scope is not None else "unknown"
+            stall = {
+                "at": time.time(),
+                "route": route,
+                "path": scope.get("path") if scope is not None else None,
+                "blocked_ms": round(blocked * 1000, 1),
+                "stack": collapse_stack(frame)
+            }
+            LOOP_STALLS.labels(route).inc()
+            self.stalls.append(stall)
+            self._stall = stall
+            # Innermost frames only; the asyncio and ASGI layers below them are noise in a log line
+            logger.warning(
+                "Event loop blocked for %.0f ms+ serving %s %s in %s",
+                stall["blocked_ms"], route, stall["path"] or "", " <- ".join(reversed(stall["stack"][-8:]))
+            )
@@ -0,0 +1,93 @@
+"""
+Resume Cache - Content-addressed store for parsed resumes
+Keyed by a hash of the uploaded bytes plus the SKILL_DB version, so a
+re-uploaded PDF skips decoding entirely. In-memory LRU tier with an
+optional SQLite tier that survives restarts
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from resume_parser import SKILL_DB_VERSION
+
+# Defaults, overridable through the environment
+RESUME_CACHE_SIZE = int(os.getenv("SKILL_TWIN_RESUME_CACHE_SIZE", "256"))
+RESUME_CACHE_DB = os.getenv("SKILL_TWIN_RESUME_CACHE_DB")  # unset = memory only
+
+
+def resume_cache_key(content: bytes, version: str = SKILL_DB_VERSION) -> str:
+    """Content address of an upload under a given skill database"""
+    return f"{hashlib.sha256(content).hexdigest()}:{version}"
+
+
+class ResumeCache:
+    """
+    Two-tier cache of parse_resume results (extracted text + found skills).
+    Only successful parses are stored.
+    """
+
+    def __init__(self, max_entries: int = RESUME_CACHE_SIZE, db_path: Optional[str] = RESUME_CACHE_DB):
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_resumes (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        """Insert into the memory tier, evicting the least recently used entry"""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._db_lock:
+            row = self._db.execute("SELECT result FROM parsed_resumes WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_put(self, key: str, result: Dict[str, Any]):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO parsed_resumes (key, result) VALUES (?, ?)",
+                (key, json.dumps(result))
+            )
+            self._db.commit()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a parse result, promoting disk hits into memory"""
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            return result
+        if self._db is None:
+            return None
+        result = await asyncio.to_thread(self._disk_get, key)
+        if result is not None:
+            self._remember(key, result)
+        return result
+
+    async def put(self, key: str, result: Dict[str, Any]):
+        """Store a successful parse result in both tiers"""
+        if not result.get("success"):
+            return
+        self._remember(key, result)
+        if self._db is not None:
+            await asyncio.to_thread(self._disk_put, key, result)
+
+    def close(self):
+        """Close the SQLite tier"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
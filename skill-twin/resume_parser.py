@@ -4,9 +4,13 @@ Uses pypdf to extract text and match against skill database
 """
 
 from pypdf import PdfReader
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
+import hashlib
 import io
-import re
+import json
+import time
+
+from skill_matcher import SkillMatcher
 
 # Comprehensive skill database with categories
 SKILL_DB = {
@@ -99,48 +103,104 @@ SKILL_DB = {
     "scrum": {"category": "tool", "weight": 0.6},
 }
 
+# Built once at import: one scan of the text finds every skill
+SKILL_MATCHER = SkillMatcher(SKILL_DB)
+_SKILL_ORDER = {skill: index for index, skill in enumerate(SKILL_DB)}
+
+# Changes whenever a skill, weight or category changes; part of cache keys
+SKILL_DB_VERSION = hashlib.sha256(json.dumps(SKILL_DB, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def iter_pages(file_content: bytes) -> Iterator[Tuple[int, int, str]]:
+    """
+    Lazily extract PDF pages, one at a time
+    Yields: (page_number, page_count, page_text)
+    """
+    reader = PdfReader(io.BytesIO(file_content))
+    page_count = len(reader.pages)
+    for number, page in enumerate(reader.pages, start=1):
+        yield number, page_count, page.extract_text() or ""
+
+
+def score_skills(counts: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+    """Turn {skill: mentions} into scored skill entries, in SKILL_DB order"""
+    found_skills = {}
+    for skill in sorted(counts, key=_SKILL_ORDER.__getitem__):
+        count = counts[skill]
+        info = SKILL_DB[skill]
+        # Base score 0.5, bonus for multiple mentions (up to 1.5 extra)
+        base_score = 0.5 + min(count * 0.25, 1.5)
+        found_skills[skill] = {
+            "score": round(base_score * info["weight"], 2),
+            "category": info["category"],
+            "mentions": count
+        }
+    return found_skills
+
+
+def stream_resume(file_content: bytes) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a PDF resume page by page, merging skill counts as pages arrive
+    Yields one partial result per page; the full text is never assembled
+    """
+    counts: Dict[str, int] = {}
+    text_length = 0
+    started = time.perf_counter()
+    for number, page_count, page_text in iter_pages(file_content):
+        extracted = time.perf_counter()
+        # Pages never share a match: the old parser joined them with "\n"
+        page_counts = SKILL_MATCHER.count(page_text.lower()) if page_text else {}
+        matched = time.perf_counter()
+        for skill, count in page_counts.items():
+            counts[skill] = counts.get(skill, 0) + count
+        if page_text:
+            text_length += len(page_text) + 1
+
+        yield {
+            "page": number,
+            "pages": page_count,
+            "page_skills": score_skills(page_counts),
+            "skills": score_skills(counts),
+            "total_found": len(counts),
+            "text_length": text_length,
+            "timings": {"extract": extracted - started, "match": matched - extracted}
+        }
+        started = time.perf_counter()
+
 
 def parse_resume(file_content: bytes) -> Dict[str, Any]:
     """
     Parse PDF resume and extract skills
-    Returns: { "success": True, "skills": { "python": 0.5, ... }, "raw_text": "..." }
+    Returns: { "success": True, "skills": { "python": {...}, ... }, "raw_text": "...", ... }
     """
     try:
-        # Read PDF from bytes
-        pdf_file = io.BytesIO(file_content)
-        reader = PdfReader(pdf_file)
-        
-        # Extract all text
-        text = ""
-        for page in reader.pages:
-            page_text = page.extract_text()
+        counts: Dict[str, int] = {}
+        page_texts = []
+        pages = 0
+        # Matching is timed directly; everything else in the loop is pypdf
+        started = time.perf_counter()
+        match_time = 0.0
+        for _, pages, page_text in iter_pages(file_content):
             if page_text:
-                text += page_text + "\n"
-        
-        text_lower = text.lower()
-        
-        # Find matching skills
-        found_skills = {}
-        for skill, info in SKILL_DB.items():
-            # Use word boundary matching for accuracy
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                # Count occurrences for stronger signal
-                count = len(re.findall(pattern, text_lower))
-                # Base score 0.5, bonus for multiple mentions (up to 1.5 extra)
-                base_score = 0.5 + min(count * 0.25, 1.5)
-                found_skills[skill] = {
-                    "score": round(base_score * info["weight"], 2),
-                    "category": info["category"],
-                    "mentions": count
-                }
+                page_texts.append(page_text)
+                matching = time.perf_counter()
+                # Find matching skills (word boundary matching, single pass)
+                for skill, count in SKILL_MATCHER.count(page_text.lower()).items():
+                    counts[skill] = counts.get(skill, 0) + count
+                match_time += time.perf_counter() - matching
+        extract_time = time.perf_counter() - started - match_time
+
+        text = "".join(page_text + "\n" for page_text in page_texts)
+        found_skills = score_skills(counts)
         
         return {
             "success": True,
             "skills": found_skills,
             "total_found": len(found_skills),
             "text_length": len(text),
-            "pages": len(reader.pages)
+            "pages": pages,
+            "raw_text": text,
+            "timings": {"extract": extract_time, "match": match_time}
         }
         
     except Exception as e:
@@ -0,0 +1,59 @@
+"""
+Scenarios - Monte Carlo skill growth bands
+Every path draws its own velocity per skill around the projected one (how
+fast the skill really grows), then walks month by month: each month adds
+that velocity plus a fresh shock, and the score is held within 0-10 before
+the next step. Paths are stepped together as one paths x skills matrix and
+reduced to percentiles after every month, so the paths x skills x months
+cube is never held in memory
+"""
+
+from typing import Dict, Iterable
+import os
+
+import numpy as np
+
+# Defaults, overridable through the environment
+SCENARIO_PATHS = int(os.getenv("SKILL_TWIN_SCENARIO_PATHS", "10000"))
+SCENARIO_MAX_PATHS = int(os.getenv("SKILL_TWIN_SCENARIO_MAX_PATHS", "20000"))
+SCENARIO_VELOCITY_NOISE = float(os.getenv("SKILL_TWIN_SCENARIO_VELOCITY_NOISE", "0.3"))
+SCENARIO_STEP_NOISE = float(os.getenv("SKILL_TWIN_SCENARIO_STEP_NOISE", "0.1"))  # Score per month
+# Paths x skills x months per request; each month costs a draw and a percentile pass
+SCENARIO_MAX_STEPS = int(os.getenv("SKILL_TWIN_SCENARIO_MAX_STEPS", "10000000"))
+
+# Floor for the noise scale, in score per month, so flat skills still spread
+MIN_VELOCITY_SPREAD = 0.02
+
+
+def growth_bands(
+    scores: np.ndarray,
+    monthly_velocity: np.ndarray,
+    velocity_sd: np.ndarray,
+    months: int,
+    paths: int = SCENARIO_PATHS,
+    percentiles: Iterable[float] = (10, 50, 90),
+    seed: int = 0,
+    step_sd: float = SCENARIO_STEP_NOISE
+) -> Dict[float, np.ndarray]:
+    """
+    Percentile bands for every skill and month
+    scores, monthly_velocity and velocity_sd are per skill (score per month),
+    step_sd is the month-to-month shock; returns {percentile: skills x months
+    array}, months 1..`months`
+    """
+    percentiles = tuple(percentiles)
+    if not len(scores):
+        return {p: np.zeros((0, months)) for p in percentiles}
+
+    rng = np.random.default_rng(seed)
+    shape = (paths, len(scores))
+    # paths x skills, all drawn in one batch
+    velocities = monthly_velocity[None, :] + velocity_sd[None, :] * rng.standard_normal(shape)
+    current = np.broadcast_to(scores[None, :], shape).copy()
+    bands = np.empty((len(percentiles), len(scores), months))
+    for month in range(months):
+        current += velocities
+        current += step_sd * rng.standard_normal(shape)
+        np.clip(current, 0.0, 10.0, out=current)
+        bands[:, :, month] = np.percentile(current, percentiles, axis=0)
+    return {p: np.round(bands[i], 2) for i, p in enumerate(percentiles)}
@@ -0,0 +1,72 @@
+"""
+Single Flight - Request coalescing for repeated upstream work
+Concurrent calls with the same key share one in-flight task and its result;
+the next call after it settles starts fresh. Also holds the short-TTL profile
+cache that lets back-to-back dashboard syncs skip the main backend entirely
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import os
+import time
+
+# Defaults, overridable through the environment
+PROFILE_CACHE_TTL = float(os.getenv("SKILL_TWIN_PROFILE_CACHE_TTL", "5"))
+PROFILE_CACHE_SIZE = int(os.getenv("SKILL_TWIN_PROFILE_CACHE_SIZE", "1024"))
+
+
+class SingleFlight:
+    """Deduplicates concurrent awaits of the same keyed coroutine"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def _settle(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller went away
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()`, or the call already running under `key`
+        The work runs as its own task, so one caller disconnecting does not
+        cancel it for the others
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+        return await asyncio.shield(task)
+
+
+class ProfileCache:
+    """Bounded LRU of recently fetched main-app profiles, keyed by session"""
+
+    def __init__(self, ttl: float = PROFILE_CACHE_TTL, max_entries: int = PROFILE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, profile: Dict[str, Any]):
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic(), profile)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
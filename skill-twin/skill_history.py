@@ -0,0 +1,193 @@
+"""
+Skill History - Compact per-skill score time series
+Every score change is appended as a raw (timestamp, score) point. Raw points
+older than a couple of days, or beyond a skill's raw cap, are folded into
+daily rollups, and old daily rollups into monthly ones, so each skill's
+history has a fixed upper bound on memory however long the twin lives.
+Points of all skills share three flat columns per twin, tagged with the
+skill's row in SkillTwin, so a skill with one point costs three doubles
+"""
+
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import os
+
+# Defaults, overridable through the environment
+HISTORY_RAW_POINTS = int(os.getenv("SKILL_TWIN_HISTORY_RAW_POINTS", "64"))
+HISTORY_RAW_AGE = float(os.getenv("SKILL_TWIN_HISTORY_RAW_AGE", str(2 * 86400)))  # Seconds
+HISTORY_DAYS = int(os.getenv("SKILL_TWIN_HISTORY_DAYS", "90"))
+HISTORY_MONTHS = int(os.getenv("SKILL_TWIN_HISTORY_MONTHS", "60"))
+
+RESOLUTIONS = ("auto", "raw", "daily", "monthly")
+
+# Raw points are stored flat, RAW_STRIDE doubles per point: row, timestamp, score
+RAW_STRIDE = 3
+# Rollup buckets likewise, ROLLUP_STRIDE doubles per bucket: row, bucket key,
+# timestamp of the last point, last score, min, max, point count
+ROLLUP_STRIDE = 7
+
+
+def _day_key(timestamp: float) -> int:
+    return int(timestamp // 86400)
+
+
+def _month_key(timestamp: float) -> int:
+    moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return moment.year * 12 + moment.month - 1
+
+
+def _fold(rollup: array, row: float, key: int, timestamp: float, last: float, low: float, high: float,
+          count: float):
+    """
+    Merge a point (count 1) or a finer bucket into the row's bucket for `key`.
+    Buckets arrive roughly in key order, so only the newest keys are searched
+    """
+    base = len(rollup) - ROLLUP_STRIDE
+    while base >= 0 and rollup[base + 1] >= key:
+        if rollup[base] == row:
+            if rollup[base + 1] == key:
+                rollup[base + 2] = timestamp
+                rollup[base + 3] = last
+                rollup[base + 4] = min(rollup[base + 4], low)
+                rollup[base + 5] = max(rollup[base + 5], high)
+                rollup[base + 6] += count
+                return
+            break
+        base -= ROLLUP_STRIDE
+    rollup.extend((row, key, timestamp, last, low, high, count))
+
+
+def _renumbered(tier: array, stride: int, renumber: List[int]) -> array:
+    """`tier` with every entry's row mapped through `renumber`, dropping those mapped to -1"""
+    kept = array("d")
+    for base in range(0, len(tier), stride):
+        row = renumber[int(tier[base])]
+        if row < 0:
+            continue
+        kept.extend(tier[base:base + stride])
+        kept[-stride] = row
+    return kept
+
+
+class SkillHistory:
+    """
+    Score history for one twin, keyed by SkillTwin's skill rows. Tiers age
+    by the twin's newest point; rollup tiers start empty and are only
+    allocated once something ages into them
+    """
+
+    __slots__ = ("_raw", "_daily", "_monthly", "_raw_counts")
+
+    _EMPTY = array("d")  # Shared stand-in for an unallocated tier; never written to
+
+    def __init__(self):
+        self.clear()
+
+    def record(self, row: int, timestamp: float, score: float):
+        """Append one score observation for a skill row"""
+        raw = self._raw
+        raw.extend((row, timestamp, score))
+        counts = self._raw_counts
+        if row >= len(counts):
+            counts.extend([0] * (row + 1 - len(counts)))
+        counts[row] += 1
+        # Age raw points into days: the oldest ones, then the skill's own beyond its cap
+        while raw and timestamp - raw[1] > HISTORY_RAW_AGE:
+            self._age_raw(0)
+        if counts[row] > HISTORY_RAW_POINTS:
+            base = 0
+            while raw[base] != row:
+                base += RAW_STRIDE
+            self._age_raw(base)
+        # Age days into months
+        newest_day = _day_key(timestamp)
+        daily = self._daily
+        while daily and newest_day - daily[1] >= HISTORY_DAYS:
+            bucket = daily[:ROLLUP_STRIDE]
+            del daily[:ROLLUP_STRIDE]
+            if self._monthly is self._EMPTY:
+                self._monthly = array("d")
+            _fold(self._monthly, bucket[0], _month_key(bucket[2]), *bucket[2:])
+        # Drop the oldest months
+        newest_month = _month_key(timestamp)
+        monthly = self._monthly
+        while monthly and newest_month - monthly[1] >= HISTORY_MONTHS:
+            del monthly[:ROLLUP_STRIDE]
+
+    def _age_raw(self, base: int):
+        row, t, value = self._raw[base:base + RAW_STRIDE]
+        del self._raw[base:base + RAW_STRIDE]
+        self._raw_counts[int(row)] -= 1
+        if self._daily is self._EMPTY:
+            self._daily = array("d")
+        _fold(self._daily, row, _day_key(t), t, value, value, value, 1)
+
+    def renumber(self, renumber: List[int]):
+        """
+        Follow SkillTwin compacting its rows: old row -> new row, or -1 for a
+        dropped skill, whose history is freed. One pass over every tier
+        """
+        self._raw = _renumbered(self._raw, RAW_STRIDE, renumber)
+        if self._daily:
+            self._daily = _renumbered(self._daily, ROLLUP_STRIDE, renumber) or self._EMPTY
+        if self._monthly:
+            self._monthly = _renumbered(self._monthly, ROLLUP_STRIDE, renumber) or self._EMPTY
+        counts = array("I", [0]) * sum(1 for row in renumber if row >= 0)
+        for old, new in enumerate(renumber):
+            if new >= 0 and old < len(self._raw_counts):
+                counts[new] = self._raw_counts[old]
+        self._raw_counts = counts
+
+    def clear(self):
+        self._raw = array("d")
+        self._daily = self._EMPTY
+        self._monthly = self._EMPTY
+        self._raw_counts = array("I")  # Raw points per row, for the per-skill cap
+
+    def _points(self, row: int, resolution: str) -> Iterator[Tuple[float, float, float, float, int, str]]:
+        """(timestamp, score, min, max, count, tier) of one row, oldest first"""
+        tiers = (("monthly", self._monthly), ("daily", self._daily))
+        for tier, rollup in tiers:
+            if resolution in ("auto", tier):
+                for base in range(0, len(rollup), ROLLUP_STRIDE):
+                    if rollup[base] == row:
+                        _, _, t, last, low, high, count = rollup[base:base + ROLLUP_STRIDE]
+                        yield t, last, low, high, int(count), tier
+        if resolution in ("auto", "raw"):
+            raw = self._raw
+            for base in range(0, len(raw), RAW_STRIDE):
+                if raw[base] == row:
+                    t, value = raw[base + 1], raw[base + 2]
+                    yield t, value, value, value, 1, "raw"
+
+    def query(self, row: int, start: Optional[float] = None, end: Optional[float] = None,
+              resolution: str = "auto") -> List[Tuple[float, float, float, float, int, str]]:
+        """
+        Points for one skill row between `start` and `end` (epoch seconds, inclusive)
+        `auto` returns every tier, coarsest (oldest) first; the others return one tier
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Resolution must be one of {', '.join(RESOLUTIONS)}")
+        return [
+            point for point in self._points(row, resolution)
+            if (start is None or point[0] >= start) and (end is None or point[0] <= end)
+        ]
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        return {"raw": self._raw.tolist(), "daily": self._daily.tolist(), "monthly": self._monthly.tolist()}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "SkillHistory":
+        history = cls()
+        history._raw = array("d", snapshot["raw"])
+        rows = history._raw[0::RAW_STRIDE]
+        if rows:
+            history._raw_counts = array("I", [0]) * (int(max(rows)) + 1)
+            for row in rows:
+                history._raw_counts[int(row)] += 1
+        if snapshot["daily"]:
+            history._daily = array("d", snapshot["daily"])
+        if snapshot["monthly"]:
+            history._monthly = array("d", snapshot["monthly"])
+        return history
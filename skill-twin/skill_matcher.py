@@ -0,0 +1,116 @@
+"""
+Skill Matcher - Single-pass multi-pattern skill search
+Aho-Corasick automaton built once over the skill database, so every skill
+is found and counted in one scan of the text regardless of how many
+skills the database holds
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the `re` module's \\w"""
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Finds every skill of a dictionary in a text in a single pass.
+
+    Matching follows the same rules as `re.findall(r'\\b' + re.escape(skill) + r'\\b', text)`
+    for each skill on its own: a match needs a word boundary on both ends, so
+    tokens like `c++`, `c#`, `next.js` and `ci/cd` behave exactly as before,
+    overlapping skills ("react" / "react native") are each counted, and
+    repeated mentions of one skill never overlap.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: List[str] = []
+        # Per-state transition table, failure link and the skills ending there
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        # Per-skill boundary requirements: (length, first_is_word, last_is_word)
+        self._bounds: List[Tuple[int, bool, bool]] = []
+
+        seen = set()
+        for skill in skills:
+            if not skill or skill in seen:
+                continue
+            seen.add(skill)
+            self._add(skill)
+        self._build_failure_links()
+
+    def _add(self, skill: str):
+        """Insert one skill into the trie"""
+        index = len(self.skills)
+        self.skills.append(skill)
+        self._bounds.append((len(skill), _is_word_char(skill[0]), _is_word_char(skill[-1])))
+
+        state = 0
+        for ch in skill:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(index)
+
+    def _build_failure_links(self):
+        """Breadth-first pass that turns the trie into an automaton"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Inherit the outputs of the failure state so no match is lost
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Return {skill: mentions} for every skill found in `text`"""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        bounds = self._bounds
+        counts: Dict[int, int] = {}
+        last_end: Dict[int, int] = {}
+        text_len = len(text)
+
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+
+            end = pos + 1
+            after_is_word = end < text_len and _is_word_char(text[end])
+            for index in out[state]:
+                length, first_is_word, last_is_word = bounds[index]
+                start = end - length
+                # \b on the right: word-ness must change after the last char
+                if last_is_word == after_is_word:
+                    continue
+                # \b on the left: word-ness must change before the first char
+                before_is_word = start > 0 and _is_word_char(text[start - 1])
+                if first_is_word == before_is_word:
+                    continue
+                # findall never returns overlapping mentions of the same skill
+                if start < last_end.get(index, 0):
+                    continue
+                last_end[index] = end
+                counts[index] = counts.get(index, 0) + 1
+
+        skills = self.skills
+        return {skills[index]: count for index, count in sorted(counts.items())}
@@ -0,0 +1,174 @@
+"""
+Static Assets - Precompressed, cache-friendly frontend serving
+Every file under the static directory is read, hashed and compressed (gzip,
+and brotli when installed) once at startup. Requests are answered from
+memory: the best variant the client accepts, a content-hash ETag, and a
+304 for a matching If-None-Match, so files revalidate on each load but
+are only re-sent once they change
+"""
+
+from typing import Dict, Mapping, Optional, Tuple
+import gzip
+import hashlib
+import importlib.util
+import mimetypes
+import os
+import re
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse, Response
+
+# Defaults, overridable through <env_prefix>_STATIC_MIN_COMPRESS_SIZE etc.
+STATIC_MIN_COMPRESS_SIZE = 512
+STATIC_GZIP_LEVEL = 9
+
+# Brotli needs the optional `brotli` package (pip install brotli)
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+if BROTLI_AVAILABLE:
+    import brotli
+
+# Only worth compressing text-like types; images and fonts are already packed
+_COMPRESSIBLE = re.compile(r"^(text/|application/(javascript|json|xml|wasm|manifest\+json)|image/svg\+xml)")
+
+HASH_LENGTH = 16
+
+
+class Asset:
+    """One file's bytes, encodings and validators"""
+
+    __slots__ = ("media_type", "digest", "variants")
+
+    def __init__(self, body: bytes, media_type: str, min_compress_size: int = STATIC_MIN_COMPRESS_SIZE,
+                 gzip_level: int = STATIC_GZIP_LEVEL):
+        self.media_type = media_type
+        self.digest = hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+        # encoding -> body; identity is always present
+        self.variants: Dict[str, bytes] = {"identity": body}
+        if len(body) >= min_compress_size and _COMPRESSIBLE.match(media_type):
+            gzipped = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+            if len(gzipped) < len(body):
+                self.variants["gzip"] = gzipped
+            if BROTLI_AVAILABLE:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    self.variants["br"] = compressed
+
+    def etag(self, encoding: str) -> str:
+        # Distinct strong tag per representation, all sharing the content hash
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding parsed to {coding: q}"""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def etag_matches(header: str, asset: Asset) -> bool:
+    """
+    If-None-Match against the asset's content hash; any encoding's tag counts,
+    so switching encodings still revalidates
+    """
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"').split("-", 1)[0] == asset.digest:
+            return True
+    return False
+
+
+class StaticAssets:
+    """
+    In-memory static file server, usable as a mounted ASGI app or through
+    response() from a route. Settings come from <env_prefix>_STATIC_* so
+    each app keeps its own environment namespace
+    """
+
+    def __init__(self, directory: str, html: bool = False, env_prefix: str = "SKILL_TWIN"):
+        self.directory = directory
+        self.html = html
+        self.min_compress_size = int(os.getenv(f"{env_prefix}_STATIC_MIN_COMPRESS_SIZE", str(STATIC_MIN_COMPRESS_SIZE)))
+        self.gzip_level = int(os.getenv(f"{env_prefix}_STATIC_GZIP_LEVEL", str(STATIC_GZIP_LEVEL)))
+        self.assets: Dict[str, Asset] = {}
+        self._load()
+
+    def _load(self):
+        """Read, hash and compress every file"""
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                full = os.path.join(root, name)
+                path = os.path.relpath(full, self.directory).replace(os.sep, "/")
+                with open(full, "rb") as f:
+                    body = f.read()
+                media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                if media_type.startswith("text/") or media_type == "application/javascript":
+                    media_type += "; charset=utf-8"
+                self.assets[path] = Asset(body, media_type, self.min_compress_size, self.gzip_level)
+
+    def lookup(self, path: str) -> Optional[Tuple[str, Asset]]:
+        path = path.lstrip("/")
+        asset = self.assets.get(path)
+        if asset is None and self.html:
+            path = f"{path.rstrip('/')}/index.html".lstrip("/")
+            asset = self.assets.get(path)
+        return (path, asset) if asset is not None else None
+
+    def response(self, path: str, headers: Mapping[str, str], method: str = "GET") -> Response:
+        """Response for a GET/HEAD of `path`"""
+        if method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+        found = self.lookup(path)
+        if found is None:
+            return PlainTextResponse("Not Found", status_code=404)
+        _, asset = found
+
+        encoding = "identity"
+        if len(asset.variants) > 1:
+            accepted = accepted_encodings(headers.get("accept-encoding", ""))
+            for candidate in ("br", "gzip"):
+                if candidate in asset.variants and accepted.get(candidate, accepted.get("*", 0)) > 0:
+                    encoding = candidate
+                    break
+
+        response_headers = {
+            "ETag": asset.etag(encoding),
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding"
+        }
+        if etag_matches(headers.get("if-none-match", ""), asset):
+            return Response(status_code=304, headers=response_headers)
+
+        body = asset.variants[encoding]
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        response_headers["Content-Length"] = str(len(body))
+        return Response(b"" if method == "HEAD" else body, headers=response_headers, media_type=asset.media_type)
+
+    async def __call__(self, scope, receive, send):
+        # Path relative to where the app is mounted
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        response = self.response(
+            path,
+            Headers(scope=scope),
+            scope.get("method", "GET")
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,22 @@
+"""
+Test setup - skill-twin modules import each other by bare name, as they do
+when uvicorn runs main.py from this directory. progress-tracker has its own
+`main`, so run each app's tests on their own:
+    cd skill-twin && python -m pytest -q
+"""
+
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def client():
+    """TestClient over the app, with its lifespan (parse pool, job queue) running"""
+    import main
+    with TestClient(main.app) as client:
+        yield client
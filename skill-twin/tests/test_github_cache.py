@@ -0,0 +1,43 @@
+"""GitHub rate-limit handling: only real rate limits may drain the shared budget"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from github_cache import RateLimitBudget, RateLimitExhausted, is_rate_limited
+
+
+@pytest.mark.parametrize("status, headers, limited", [
+    (403, {"x-ratelimit-remaining": "0"}, True),
+    (429, {"retry-after": "30"}, True),
+    (403, {"x-ratelimit-remaining": "4211"}, False),  # Private or blocked repo
+    (403, {}, False),
+    (404, {"x-ratelimit-remaining": "0"}, False),
+    (200, {"retry-after": "30"}, False),
+])
+def test_is_rate_limited(status, headers, limited):
+    assert is_rate_limited(httpx.Response(status, headers=headers)) is limited
+
+
+def test_forbidden_reply_keeps_the_budget():
+    budget = RateLimitBudget(reserve=10)
+    budget.observe(httpx.Headers({"x-ratelimit-remaining": "4211", "x-ratelimit-reset": str(int(time.time()) + 60)}))
+    asyncio.run(budget.acquire())
+    assert budget.remaining == 4210
+
+
+def test_retry_after_pauses_callers():
+    budget = RateLimitBudget(reserve=10, max_wait=5)
+    budget.observe(httpx.Headers({"x-ratelimit-remaining": "4000", "retry-after": "600"}))
+    assert budget.remaining == 0
+    assert budget.reset_at >= time.time() + 590
+    with pytest.raises(RateLimitExhausted):
+        asyncio.run(budget.acquire())
+
+
+def test_low_budget_whose_window_already_reset_does_not_wait():
+    budget = RateLimitBudget(reserve=10)
+    budget.observe(httpx.Headers({"x-ratelimit-remaining": "3", "x-ratelimit-reset": str(int(time.time()) - 1)}))
+    asyncio.run(asyncio.wait_for(budget.acquire(), 0.2))
@@ -0,0 +1,52 @@
+"""Repo page fetching must not leave page requests running after a failure"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import github_connector
+from github_connector import RepoAccumulator, _fetch_remaining_pages
+
+LAST = '<https://api.github.com/user/1/repos?per_page=100&page=5>; rel="last"'
+
+
+def test_failed_page_cancels_the_others():
+    started, cancelled = set(), set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        started.add(page)
+        if page == 2:
+            raise httpx.ConnectError("connection reset", request=request)
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.add(page)
+            raise
+        return httpx.Response(200, json=[])
+
+    async def scenario():
+        github_connector.github_cache.clear()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await _fetch_remaining_pages(client, {}, LAST, RepoAccumulator())
+
+    asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert cancelled == started - {2} and cancelled
+
+
+def test_pages_are_folded_in():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=[{"name": f"repo{page}", "language": "Go", "stargazers_count": page}])
+
+    async def scenario():
+        github_connector.github_cache.clear()
+        repos = RepoAccumulator()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await _fetch_remaining_pages(client, {}, LAST, repos)
+        return repos
+
+    repos = asyncio.run(scenario())
+    assert repos.total_stars == 2 + 3 + 4 + 5
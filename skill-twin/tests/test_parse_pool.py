@@ -0,0 +1,56 @@
+"""ParsePool must survive its worker processes dying"""
+
+import asyncio
+import os
+import signal
+
+from parse_pool import ParsePool
+
+
+def crash_worker(_content, _timeout):
+    """Stands in for a PDF that kills its worker (e.g. the OOM killer)"""
+    os._exit(1)
+
+
+def test_broken_pool_between_jobs_is_replaced():
+    async def scenario():
+        pool = ParsePool(workers=1)
+        pool.start()
+        broken = pool._executor
+        pid = await asyncio.wrap_future(broken.submit(os.getpid))
+        os.kill(pid, signal.SIGKILL)
+        while not broken._broken:
+            await asyncio.sleep(0.01)
+        try:
+            return await pool.parse(b"not a pdf"), pool._executor is not broken
+        finally:
+            pool.shutdown()
+
+    result, replaced = asyncio.run(scenario())
+    assert replaced
+    assert result["success"] is False and "crashed" not in result["error"]
+
+
+def test_worker_crash_is_a_parse_error_and_the_pool_recovers(monkeypatch):
+    async def scenario():
+        pool = ParsePool(workers=1)
+        try:
+            monkeypatch.setattr("parse_pool._parse_with_deadline", crash_worker)
+            crashed = await pool.parse(b"%PDF-hostile")
+            monkeypatch.undo()
+            return crashed, pool.in_flight, await pool.parse(b"not a pdf")
+        finally:
+            pool.shutdown()
+
+    crashed, in_flight, after = asyncio.run(scenario())
+    assert crashed == {"success": False, "error": "Resume parser crashed on this file", "skills": {}}
+    assert in_flight == 0
+    assert after["success"] is False and "crashed" not in after["error"]
+
+
+def test_upload_endpoint_reports_a_crash_as_a_bad_file(client, monkeypatch):
+    monkeypatch.setattr("parse_pool._parse_with_deadline", crash_worker)
+    response = client.post("/api/upload_resume", files={"file": ("cv.pdf", b"%PDF-crash-endpoint", "application/pdf")},
+                           headers={"Authorization": "Bearer p1"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Resume parser crashed on this file"
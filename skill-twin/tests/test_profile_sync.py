@@ -0,0 +1,73 @@
+"""Incremental profile syncs must land where a full rebuild from the same profile would"""
+
+from profile_sync import apply_profile, diff_records, profile_records
+from twin_core import SkillTwin
+
+PROFILE = {
+    "derivedSkills": [
+        {"id": "s1", "name": "Python", "confidence": 0.8, "addedAt": "2026-01-01"},
+        {"id": "s2", "name": "SQL", "confidence": 0.4, "addedAt": "2026-01-02"},
+    ],
+    "certificates": [
+        {"id": "c1", "name": "Machine Learning Specialization", "uploadedAt": "2026-02-01"},
+    ],
+    "githubRepos": [
+        {"id": "r1", "repoName": "api", "languages": ["Python", "Go"], "fetchedAt": "2026-03-01"},
+        {"id": "r2", "repoName": "legacy", "languages": {"Java": 1200}, "fetchedAt": "2026-03-01"},
+    ],
+}
+
+
+def rebuilt(profile):
+    twin = SkillTwin()
+    apply_profile(twin, profile)
+    return twin
+
+
+def scores(twin):
+    return {name: entry["score"] for name, entry in twin.get_skills().items()}
+
+
+def test_first_sync_is_a_full_rebuild():
+    twin = SkillTwin()
+    changes = apply_profile(twin, PROFILE)
+    assert changes == {"full_rebuild": True, "added": 6, "removed": 0}
+    assert scores(twin) == {"python": 9.0, "sql": 4.0, "machine learning": 3.0, "go": 1.0, "java": 1.0}
+
+
+def test_unchanged_profile_touches_nothing():
+    twin = rebuilt(PROFILE)
+    version = twin.version
+    assert apply_profile(twin, PROFILE) == {"full_rebuild": False, "added": 0, "removed": 0}
+    assert twin.version == version
+
+
+def test_incremental_sync_matches_a_rebuild():
+    twin = rebuilt(PROFILE)
+    changed = {
+        "derivedSkills": [
+            {"id": "s1", "name": "Python", "confidence": 0.9, "addedAt": "2026-04-01"},
+            {"id": "s3", "name": "Docker", "confidence": 0.5, "addedAt": "2026-04-01"},
+        ],
+        "certificates": PROFILE["certificates"],
+        "githubRepos": PROFILE["githubRepos"][:1],
+    }
+    changes = apply_profile(twin, changed)
+    assert changes["full_rebuild"] is False
+    assert scores(twin) == scores(rebuilt(changed))
+    assert twin.sync_records == profile_records(changed)
+
+
+def test_cleared_twin_rebuilds_again():
+    twin = rebuilt(PROFILE)
+    twin.clear_skills()
+    assert apply_profile(twin, PROFILE)["full_rebuild"] is True
+    assert scores(twin) == scores(rebuilt(PROFILE))
+
+
+def test_diff_records_retracts_changed_and_removed_records():
+    old = {("skill", "s1", "a"): (("python", 8.0, "main-app"),), ("repo", "r1", "a"): (("go", 1.0, "github"),)}
+    new = {("skill", "s1", "a"): (("python", 9.0, "main-app"),)}
+    added, removed = diff_records(old, new)
+    assert added == [("python", 9.0, "main-app")]
+    assert sorted(removed) == [("go", 1.0, "github"), ("python", 8.0, "main-app")]
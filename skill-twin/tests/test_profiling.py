@@ -0,0 +1,44 @@
+"""Admin profiling endpoints: hidden without a token, and their request checks"""
+
+import pytest
+
+import main
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    monkeypatch.setattr("profiling.ADMIN_TOKEN", ADMIN_TOKEN)
+    monkeypatch.setattr(main, "ADMIN_TOKEN", ADMIN_TOKEN)
+    return {"X-Admin-Token": ADMIN_TOKEN}
+
+
+def test_hidden_without_an_admin_token(client, monkeypatch):
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+    assert client.post("/api/admin/profile", headers={"X-Admin-Token": ""}).status_code == 404
+    assert client.get("/api/admin/loop_lag").status_code == 404
+
+
+def test_requires_the_admin_token(client, admin):
+    assert client.post("/api/admin/profile", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/api/admin/loop_lag").status_code == 403
+
+
+@pytest.mark.parametrize("params", [
+    {"seconds": "0"},
+    {"seconds": "nan"},
+    {"seconds": "inf"},
+    {"seconds": "1e9"},
+    {"seconds": "0.1", "interval_ms": "0"},
+    {"seconds": "0.1", "interval_ms": "nan"},
+    {"seconds": "0.1", "format": "svg"},
+])
+def test_profile_rejects_bad_requests(client, admin, params):
+    assert client.post("/api/admin/profile", params=params, headers=admin).status_code == 400
+
+
+def test_profile_samples(client, admin):
+    response = client.post("/api/admin/profile", params={"seconds": "0.1", "format": "json"}, headers=admin)
+    assert response.status_code == 200
+    assert response.json()["samples"] > 0
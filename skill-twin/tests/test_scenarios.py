@@ -0,0 +1,82 @@
+"""Monte Carlo growth bands, and the /api/simulate/scenarios request checks"""
+
+import numpy as np
+import pytest
+
+from scenarios import SCENARIO_MAX_STEPS, growth_bands
+
+
+def bands(**overrides):
+    args = dict(
+        scores=np.array([2.0, 5.0, 9.5]),
+        monthly_velocity=np.array([0.2, 0.0, 0.5]),
+        velocity_sd=np.array([0.05, 0.05, 0.05]),
+        months=12,
+        paths=2000,
+        percentiles=(10, 50, 90),
+        seed=1
+    )
+    args.update(overrides)
+    return growth_bands(**args)
+
+
+def test_bands_are_ordered_bounded_and_seeded():
+    result = bands()
+    assert set(result) == {10, 50, 90}
+    assert all(band.shape == (3, 12) for band in result.values())
+    assert np.all(result[10] <= result[50]) and np.all(result[50] <= result[90])
+    assert all(np.all((band >= 0) & (band <= 10)) for band in result.values())
+    again = bands()
+    assert all(np.array_equal(result[p], again[p]) for p in result)
+    assert not np.array_equal(result[90], bands(seed=2)[90])
+
+
+def test_paths_move_month_to_month_not_in_straight_lines():
+    # With no velocity spread at all, only the monthly shocks separate the paths
+    result = bands(velocity_sd=np.zeros(3), step_sd=0.1)
+    spread = result[90][1] - result[10][1]
+    assert spread[0] > 0
+    # A random walk's spread grows like the square root of the months, not linearly
+    assert spread[-1] == pytest.approx(spread[0] * np.sqrt(12), rel=0.25)
+    straight = bands(velocity_sd=np.zeros(3), step_sd=0.0)
+    assert np.array_equal(straight[10], straight[90])
+
+
+def test_no_skills_gives_empty_bands():
+    result = bands(scores=np.zeros(0), monthly_velocity=np.zeros(0), velocity_sd=np.zeros(0))
+    assert result[50].shape == (0, 12)
+
+
+@pytest.mark.parametrize("body", [
+    {"seed": -1},
+    {"months": 0},
+    {"paths": 50},
+    {"velocity_noise": 6},
+    {"percentiles": []},
+    {"percentiles": [10, 101]},
+    {"boosts": {"python": 11}},
+])
+def test_scenarios_endpoint_rejects_bad_requests(client, body):
+    response = client.post("/api/simulate/scenarios", json=body, headers={"Authorization": "Bearer s1"})
+    assert response.status_code == 400
+
+
+def test_scenarios_endpoint_rejects_oversized_work(client):
+    headers = {"Authorization": "Bearer s2"}
+    boosts = {f"skill{i}": 1.0 for i in range(50)}
+    months = SCENARIO_MAX_STEPS // (10000 * 50) + 1
+    response = client.post("/api/simulate/scenarios", json={"months": months, "paths": 10000, "boosts": boosts},
+                           headers=headers)
+    assert response.status_code == 400
+
+
+def test_scenarios_endpoint(client):
+    headers = {"Authorization": "Bearer s3"}
+    response = client.post("/api/simulate/scenarios",
+                           json={"months": 6, "paths": 500, "seed": 4, "boosts": {"rust": 0.5}}, headers=headers)
+    assert response.status_code == 200
+    simulation = response.json()["simulation"]
+    assert simulation["months"] == [1, 2, 3, 4, 5, 6]
+    rust = simulation["future_state"]["rust"]
+    assert rust["current_score"] == 0 and len(rust["p50"]) == 6
+    assert rust["p10"][-1] <= rust["p50"][-1] <= rust["p90"][-1]
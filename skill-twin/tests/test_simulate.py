@@ -0,0 +1,29 @@
+"""Request checks of the simulation endpoints"""
+
+import pytest
+
+HEADERS = {"Authorization": "Bearer sim"}
+
+
+@pytest.mark.parametrize("body", [
+    {"horizons": []},
+    {"horizons": [0, 6]},
+    {"horizons": list(range(1, 122))},
+    {"step": 0},
+    {"start": 1, "end": 10 ** 12},  # Rejected by length, before a list is built
+    {"start": 0, "end": 12},
+])
+def test_horizons_rejects_bad_requests(client, body):
+    assert client.post("/api/simulate/horizons", json=body, headers=HEADERS).status_code == 400
+
+
+def test_horizons(client):
+    client.post("/api/set_name", json={"name": "S"}, headers=HEADERS)
+    response = client.post("/api/simulate/horizons", json={"start": 3, "end": 12, "step": 3}, headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()["simulation"]["horizons"] == [3, 6, 9, 12]
+
+
+@pytest.mark.parametrize("months", [0, 121])
+def test_simulate_rejects_months_out_of_range(client, months):
+    assert client.post("/api/simulate", json={"months": months}, headers=HEADERS).status_code == 400
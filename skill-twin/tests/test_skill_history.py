@@ -0,0 +1,94 @@
+"""SkillHistory tiering, row renumbering and snapshots, and the /api/history endpoint"""
+
+import pytest
+
+import skill_history
+from skill_history import SkillHistory
+from twin_core import SkillTwin
+
+DAY = 86400
+START = 1_750_000_000.0
+
+
+def test_raw_cap_folds_a_skills_oldest_points_into_days(monkeypatch):
+    monkeypatch.setattr(skill_history, "HISTORY_RAW_POINTS", 4)
+    history = SkillHistory()
+    for i in range(10):
+        history.record(0, START + i, float(i))
+        history.record(1, START + i, 100.0 + i)
+    raw = history.query(0, resolution="raw")
+    assert [point[1] for point in raw] == [6.0, 7.0, 8.0, 9.0]
+    (daily,) = history.query(0, resolution="daily")
+    assert daily[1:5] == (5.0, 0.0, 5.0, 6)  # Last, min, max, count
+    assert len(history.query(1, resolution="raw")) == 4
+
+
+def test_old_points_age_into_days_then_months():
+    history = SkillHistory()
+    for day in range(0, 200, 10):
+        history.record(0, START + day * DAY, float(day))
+    tiers = [point[5] for point in history.query(0)]
+    assert tiers == sorted(tiers, key=("monthly", "daily", "raw").index)
+    assert {"monthly", "daily", "raw"} == set(tiers)
+    assert sum(point[4] for point in history.query(0)) == 20  # No point lost, only folded
+    assert history.query(0, start=START + 150 * DAY, resolution="daily")[0][0] >= START + 150 * DAY
+
+
+def test_renumber_follows_dropped_rows(monkeypatch):
+    monkeypatch.setattr(skill_history, "HISTORY_RAW_POINTS", 2)
+    history = SkillHistory()
+    for i in range(3):
+        for row in range(3):
+            history.record(row, START + i, row * 10.0 + i)
+    history.renumber([-1, 0, 1])
+    assert [point[1] for point in history.query(0)] == [10.0, 11.0, 12.0]
+    assert [point[1] for point in history.query(1)] == [20.0, 21.0, 22.0]
+    assert history.query(2) == []
+    # The per-row raw counts followed too: the cap still applies to the renumbered rows
+    history.record(0, START + 3, 13.0)
+    assert [point[1] for point in history.query(0, resolution="raw")] == [12.0, 13.0]
+
+
+def test_snapshot_round_trip_keeps_the_raw_cap(monkeypatch):
+    monkeypatch.setattr(skill_history, "HISTORY_RAW_POINTS", 3)
+    history = SkillHistory()
+    for i in range(5):
+        history.record(0, START + i, float(i))
+        history.record(2, START + i, float(i))
+    restored = SkillHistory.from_snapshot(history.to_snapshot())
+    assert restored.to_snapshot() == history.to_snapshot()
+    history.record(2, START + 5, 5.0)
+    restored.record(2, START + 5, 5.0)
+    assert restored.to_snapshot() == history.to_snapshot()
+
+
+def test_query_rejects_unknown_resolution():
+    with pytest.raises(ValueError):
+        SkillHistory().query(0, resolution="hourly")
+
+
+def test_dropping_a_skill_keeps_the_others_history():
+    twin = SkillTwin()
+    twin.update_skills([("python", 2, "test"), ("go", 1, "test"), ("sql", 3, "test")])
+    twin.update_skill("sql", 1, "test")
+    twin.retract_skills([("go", 1), ("python", 0.5)])
+    history = twin.get_history()
+    assert set(history) == {"python", "sql"}
+    assert [point["score"] for point in history["python"]] == [2.0, 1.5]
+    assert [point["score"] for point in history["sql"]] == [3.0, 4.0]
+
+
+def test_history_endpoint_rejects_unknown_resolution_before_the_lookup(client):
+    import main
+    twins = len(main.twin_store)
+    response = client.get("/api/history", params={"resolution": "hourly"}, headers={"Authorization": "Bearer h1"})
+    assert response.status_code == 400
+    assert len(main.twin_store) == twins  # No twin was created for the bad request
+
+
+def test_history_endpoint(client):
+    headers = {"Authorization": "Bearer h2"}
+    client.post("/api/set_name", json={"name": "H"}, headers=headers)
+    response = client.get("/api/history", params={"skill": "python", "resolution": "raw"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "resolution": "raw", "history": {"python": []}}
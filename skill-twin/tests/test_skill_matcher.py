@@ -0,0 +1,50 @@
+"""SkillMatcher must count exactly what the per-skill \\b regex loop counted"""
+
+import random
+import re
+
+import pytest
+
+from resume_parser import SKILL_DB
+from skill_matcher import SkillMatcher
+
+
+def regex_count(skills, text):
+    """The matching loop parse_resume used before SkillMatcher"""
+    counts = {}
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text):
+            counts[skill] = len(re.findall(pattern, text))
+    return counts
+
+
+@pytest.mark.parametrize("text", [
+    "c++ and c# with next.js, ci/cd pipelines and react native apps in react",
+    "java javascript typescript; go golang (rust) node.js nodejs",
+    "aaa aa a aaaa",
+    "c++c++ c++, c++. __python python_ python3 python",
+    "",
+])
+def test_matches_regex_on_known_cases(text):
+    skills = list(SKILL_DB) + ["a", "aa", "aaa", "c++c++"]
+    assert SkillMatcher(skills).count(text) == regex_count(skills, text)
+
+
+def test_matches_regex_on_random_text():
+    rng = random.Random(7)
+    skills = list(SKILL_DB)
+    vocabulary = skills + ["and", "with", ",", ".", "/", "-", "+", "#", "(", ")", "_", "x"]
+    matcher = SkillMatcher(skills)
+    for _ in range(200):
+        text = "".join(
+            rng.choice(vocabulary) + rng.choice(("", " ", "  ", "\n"))
+            for _ in range(rng.randint(0, 40))
+        )
+        assert matcher.count(text) == regex_count(skills, text), text
+
+
+def test_skips_empty_and_duplicate_skills():
+    matcher = SkillMatcher(["python", "", "python"])
+    assert matcher.skills == ["python"]
+    assert matcher.count("python, python") == {"python": 2}
@@ -0,0 +1,62 @@
+"""Running aggregates must match a from-scratch recomputation after any sequence of changes"""
+
+import random
+import statistics
+
+import pytest
+
+from twin_core import SkillTwin
+
+
+def assert_aggregates_match(twin):
+    """Welford mean and squared deviations against a two-pass recomputation"""
+    scores = twin.get_skill_scores()
+    velocities = [entry["velocity"] for entry in twin.get_skills().values()]
+    assert twin._count == len(scores)
+    if scores:
+        assert twin._score_mean == pytest.approx(statistics.fmean(scores), abs=1e-9)
+        assert twin._score_m2 == pytest.approx(statistics.pvariance(scores) * len(scores), abs=1e-6)
+        assert twin._velocity_sum == pytest.approx(sum(velocities), abs=1e-9)
+    attributes = twin.get_state()["attributes"]
+    assert attributes["total_skills"] == len(scores)
+    if len(scores) > 1:
+        std_dev = statistics.pstdev(scores)
+        assert attributes["consistency"] == pytest.approx(max(0, 1 - std_dev / 5), abs=1e-3)
+
+
+def test_welford_matches_recomputation_under_random_changes():
+    rng = random.Random(3)
+    twin = SkillTwin()
+    names = [f"skill{i}" for i in range(12)]
+    for _ in range(300):
+        name = rng.choice(names)
+        action = rng.random()
+        if action < 0.6:
+            twin.update_skill(name, rng.uniform(0.1, 4.0), "test")
+        elif action < 0.8:
+            twin.retract_skill(name, rng.uniform(0.1, 4.0))
+        elif action < 0.9:
+            twin.update_skills([(rng.choice(names), rng.uniform(0.1, 2.0), "batch") for _ in range(5)])
+        else:
+            twin.retract_skills([(rng.choice(names), rng.uniform(0.1, 2.0)) for _ in range(5)])
+        assert_aggregates_match(twin)
+
+
+def test_replace_and_clear_restart_the_aggregates():
+    twin = SkillTwin()
+    twin.update_skills([("python", 5, "resume"), ("java", 2, "resume"), ("go", 8, "resume")])
+    twin.replace_skills([("python", 3, "resume"), ("rust", 6, "resume")])
+    assert twin.get_skill_names() == ["python", "rust"]
+    assert_aggregates_match(twin)
+    twin.clear_skills()
+    assert twin.get_state()["attributes"] == {"velocity": 0.0, "consistency": 0.0, "total_skills": 0}
+
+
+def test_retracting_everything_drops_the_skill():
+    twin = SkillTwin()
+    twin.update_skill("python", 2.5, "test")
+    twin.update_skill("sql", 1.0, "test")
+    assert twin.retract_skill("python", 2.5) is None
+    assert twin.get_skill_names() == ["sql"]
+    assert twin.history.query(0)[-1][1] == 1.0
+    assert_aggregates_match(twin)
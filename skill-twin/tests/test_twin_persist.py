@@ -0,0 +1,64 @@
+"""Twins must come back from a snapshot, and from SQLite, exactly as they were saved"""
+
+import asyncio
+import json
+
+from profile_sync import apply_profile
+from twin_core import SkillTwin
+from twin_persist import TwinPersistence
+
+
+def populated_twin():
+    twin = SkillTwin()
+    twin.set_name("Ada")
+    apply_profile(twin, {"derivedSkills": [{"id": "s1", "name": "Python", "confidence": 0.6, "addedAt": "x"}]})
+    for impact in (1.0, 0.5, 2.0):
+        twin.update_skill("sql", impact, "resume")
+    twin.update_skill("go", 3.0, "github")
+    twin.retract_skill("go", 1.0)
+    twin.raise_attributes(0.9, 0.8)
+    return twin
+
+
+def assert_same_twin(restored, twin):
+    assert restored.get_state() == twin.get_state()
+    assert restored.get_history() == twin.get_history()
+    assert restored.sync_records == twin.sync_records
+    assert restored.simulate_horizons([1, 6, 12]) == twin.simulate_horizons([1, 6, 12])
+    assert restored.to_snapshot() == twin.to_snapshot()
+
+
+def test_snapshot_round_trip_through_json():
+    twin = populated_twin()
+    restored = SkillTwin.from_snapshot(json.loads(json.dumps(twin.to_snapshot())))
+    assert_same_twin(restored, twin)
+    # The restored twin keeps working like the original
+    restored.update_skill("sql", 1.0, "resume")
+    twin.update_skill("sql", 1.0, "resume")
+    assert restored.get_skills()["sql"]["score"] == twin.get_skills()["sql"]["score"]
+    assert restored.get_state()["attributes"] == twin.get_state()["attributes"]
+
+
+def test_empty_twin_round_trip():
+    twin = SkillTwin()
+    assert_same_twin(SkillTwin.from_snapshot(json.loads(json.dumps(twin.to_snapshot()))), twin)
+
+
+def test_persistence_writes_and_restores(tmp_path):
+    async def scenario():
+        twin = populated_twin()
+        persistence = TwinPersistence(str(tmp_path / "twins.db"), flush_interval=60)
+        await persistence.start()
+        persistence.mark_dirty("session", twin)
+        assert await persistence.load("session") is twin  # Still pending, served from memory
+        await persistence.stop()
+
+        reopened = TwinPersistence(str(tmp_path / "twins.db"))
+        restored = await reopened.load("session")
+        missing = await reopened.load("other")
+        await reopened.stop()
+        return twin, restored, missing
+
+    twin, restored, missing = asyncio.run(scenario())
+    assert missing is None
+    assert_same_twin(restored, twin)
@@ -0,0 +1,111 @@
+"""
+Trend Estimator - Exponentially weighted least-squares skill trends
+Each skill keeps the decayed sufficient statistics of a weighted linear
+regression of score on time. Every score change folds one point in, O(1),
+so projections never refit; all skills are fitted together in one NumPy
+pass, with confidence bands from the weighted residuals
+"""
+
+from array import array
+from typing import Dict, List
+import os
+
+import numpy as np
+
+# Defaults, overridable through the environment
+TREND_HALF_LIFE = float(os.getenv("SKILL_TWIN_TREND_HALF_LIFE", "6"))  # Months until a point counts half
+TREND_MIN_SPREAD_DAYS = float(os.getenv("SKILL_TWIN_TREND_MIN_SPREAD_DAYS", "7"))
+TREND_MIN_POINTS = float(os.getenv("SKILL_TWIN_TREND_MIN_POINTS", "3"))  # Effective, after decay
+TREND_Z = float(os.getenv("SKILL_TWIN_TREND_Z", "1.645"))  # Two-sided 90% band
+
+SECONDS_PER_MONTH = 30.4375 * 86400
+
+# Per-skill statistics are stored flat, STRIDE doubles per skill
+ORIGIN, LAST, W, W2, T, Y, TT, TY, YY = range(9)
+STRIDE = 9
+
+
+class TrendEstimator:
+    """
+    Rows line up with SkillTwin's skill rows. Time is in months since each
+    skill's first observation, and weights decay by half every
+    `TREND_HALF_LIFE` months, so recent updates dominate the fit
+    """
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats: List[float] = ()):
+        self._stats = array("d", stats)
+
+    def __len__(self) -> int:
+        return len(self._stats) // STRIDE
+
+    def add_row(self, timestamp: float, score: float):
+        """Start statistics for a new skill from its first observation"""
+        self._stats.extend((timestamp, 0.0, 1.0, 1.0, 0.0, score, 0.0, 0.0, score * score))
+
+    def observe(self, row: int, timestamp: float, score: float):
+        """Decay a skill's statistics to `timestamp`, then add one point"""
+        stats = self._stats
+        base = row * STRIDE
+        t = (timestamp - stats[base + ORIGIN]) / SECONDS_PER_MONTH
+        decay = 0.5 ** (max(0.0, t - stats[base + LAST]) / TREND_HALF_LIFE)
+        for field in (W, T, Y, TT, TY, YY):
+            stats[base + field] *= decay
+        stats[base + W2] *= decay * decay
+        stats[base + LAST] = max(t, stats[base + LAST])
+        stats[base + W] += 1.0
+        stats[base + W2] += 1.0
+        stats[base + T] += t
+        stats[base + Y] += score
+        stats[base + TT] += t * t
+        stats[base + TY] += t * score
+        stats[base + YY] += score * score
+
+    def keep_rows(self, rows: List[int]):
+        """Keep only `rows`, in that order (SkillTwin dropping skills)"""
+        stats = self._stats
+        self._stats = array("d", [value for row in rows for value in stats[row * STRIDE:(row + 1) * STRIDE]])
+
+    def to_snapshot(self) -> List[float]:
+        return self._stats.tolist()
+
+    def fit(self) -> Dict[str, np.ndarray]:
+        """
+        Weighted fit for every skill at once
+        Returns per-row arrays: fitted (enough spread and points for a trend),
+        slope (score per month), sigma2 (residual variance), n_eff and stt
+        (effective sum of squared time deviations)
+        """
+        if not self._stats:
+            empty = np.zeros(0)
+            return {"fitted": empty.astype(bool), "slope": empty, "sigma2": empty, "n_eff": empty, "stt": empty}
+        stats = np.frombuffer(self._stats, dtype=np.float64).reshape(-1, STRIDE)
+        w = stats[:, W]
+        mean_t = stats[:, T] / w
+        mean_y = stats[:, Y] / w
+        stt = stats[:, TT] - w * mean_t ** 2
+        sty = stats[:, TY] - w * mean_t * mean_y
+        syy = stats[:, YY] - w * mean_y ** 2
+        n_eff = w ** 2 / stats[:, W2]
+
+        min_spread = TREND_MIN_SPREAD_DAYS * 86400 / SECONDS_PER_MONTH
+        fitted = (n_eff >= TREND_MIN_POINTS) & (stt > w * min_spread ** 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(fitted, sty / stt, 0.0)
+            sse = np.maximum(syy - slope * sty, 0.0)
+            # Residual variance per point, rescaled from weights to effective counts
+            sigma2 = np.where(fitted, sse / w * n_eff / np.maximum(n_eff - 2, 1e-9), 0.0)
+            stt_eff = np.where(fitted, stt * n_eff / w, 1.0)
+        return {"fitted": fitted, "slope": slope, "sigma2": sigma2, "n_eff": n_eff, "stt": stt_eff}
+
+    @staticmethod
+    def band(fit: Dict[str, np.ndarray], months: np.ndarray) -> np.ndarray:
+        """
+        Half-width of the confidence band, skills x horizons, for a projection
+        `months` ahead (normal approximation). Projections start from the last
+        observed score, not the fitted line, so its full residual variance
+        counts once, plus the slope's uncertainty growing with the horizon
+        """
+        variance = fit["sigma2"][:, None] * (1 + months[None, :] ** 2 / fit["stt"][:, None])
+        return TREND_Z * np.sqrt(variance)
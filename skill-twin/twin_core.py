@@ -3,56 +3,266 @@ SkillTwin - Digital Twin Core Logic
 Manages skill state, velocity tracking, and future simulation
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from array import array
+from collections import OrderedDict
 from datetime import datetime
+import numpy as np
+import sys
+import time
+
+from skill_history import SkillHistory
+from trend_estimator import TrendEstimator
+from scenarios import MIN_VELOCITY_SPREAD, SCENARIO_PATHS, SCENARIO_VELOCITY_NOISE, growth_bands
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
 
 class SkillTwin:
+    """
+    Skills are stored column-wise: interned names map to a row in parallel
+    float arrays (score, velocity, epoch timestamp), so a twin costs a few
+    dozen bytes per skill instead of a dict with an ISO string per skill.
+    The JSON shape of `get_state()` is materialized lazily and cached until
+    the next change
+    """
+
+    __slots__ = (
+        "state", "_index", "_names", "_sources", "_raw", "_scores", "_velocities", "_updated_at",
+        "_last_updated", "sync_records", "history", "_trend", "_skills_view", "_batch_depth", "version", "_sim_cache", "_sim_cache_version",
+        "update_count", "_count", "_score_mean", "_score_m2", "_velocity_sum"
+    )
+
+    # Simulation results kept per twin version
+    SIM_CACHE_SIZE = 16
+
     def __init__(self):
+        self._reset_accumulators()
+        self._batch_depth = 0
+        # Bumped by every change that can alter a simulation
+        self.version = 0
+        self._sim_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._sim_cache_version = 0
+        # update_skill calls since the twin was created or restored, for metrics
+        self.update_count = 0
+        self._clear_columns()
+        self._last_updated: Optional[float] = None
+        # Everything except the skills and the timestamp, which are materialized on demand
         self.state = {
             "name": "Guest",
-            "skills": {},
             "attributes": {
                 "velocity": 0.0,
                 "consistency": 0.0,
                 "total_skills": 0
             },
-            "last_updated": None,
             "github_connected": False,
             "resume_uploaded": False
         }
 
+    def _clear_columns(self):
+        """Empty skill storage"""
+        self._index: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._sources: List[str] = []
+        self._raw = array("d")  # Uncapped sum of impacts, so contributions can be retracted
+        self._scores = array("d")
+        self._velocities = array("d")
+        self._updated_at = array("d")
+        self._trend = TrendEstimator()  # Per-skill regression statistics, same rows
+        self.history = SkillHistory()  # Per-skill score history, same rows
+        self._skills_view: Optional[Dict[str, Dict]] = None
+        # Main-app profile records behind the current rows, set by profile_sync
+        self.sync_records: Optional[Dict[tuple, tuple]] = None
+
+    def _skill_entry(self, row: int) -> Dict:
+        """One skill in its public JSON shape"""
+        return {
+            "score": self._scores[row],
+            "velocity": self._velocities[row],
+            "source": self._sources[row],
+            "last_update": _iso(self._updated_at[row])
+        }
+
+    def _touch(self):
+        self._last_updated = time.time()
+
+    def _bump(self):
+        self.version += 1
+
+    def _memoized(self, key: tuple, compute) -> Dict:
+        """Serve a simulation for the current version from cache, else compute it"""
+        if self._sim_cache_version != self.version:
+            # Anything cached belongs to an older version
+            self._sim_cache.clear()
+            self._sim_cache_version = self.version
+        result = self._sim_cache.get(key)
+        if result is None:
+            result = compute()
+            self._sim_cache[key] = result
+            if len(self._sim_cache) > self.SIM_CACHE_SIZE:
+                self._sim_cache.popitem(last=False)
+        else:
+            self._sim_cache.move_to_end(key)
+        return result
+
+    def _reset_accumulators(self):
+        """Running aggregates behind the global attributes"""
+        self._count = 0
+        self._score_mean = 0.0
+        self._score_m2 = 0.0  # Welford sum of squared deviations
+        self._velocity_sum = 0.0
+
+    def _add_to_accumulators(self, score: float, velocity: float):
+        self._count += 1
+        delta = score - self._score_mean
+        self._score_mean += delta / self._count
+        self._score_m2 += delta * (score - self._score_mean)
+        self._velocity_sum += velocity
+
+    def _remove_from_accumulators(self, score: float, velocity: float):
+        self._count -= 1
+        if self._count == 0:
+            self._reset_accumulators()
+            return
+        delta = score - self._score_mean
+        self._score_mean -= delta / self._count
+        self._score_m2 = max(0.0, self._score_m2 - delta * (score - self._score_mean))
+        self._velocity_sum -= velocity
+
     def update_skill(self, name: str, impact: float, source: str = "unknown") -> Dict:
         """Add or update a skill. Impact adds to score, capped at 10.0"""
         name_lower = name.lower().strip()
+        now = time.time()
+        row = self._index.get(name_lower)
+        self.update_count += 1
         
-        if name_lower in self.state["skills"]:
-            current = self.state["skills"][name_lower]
-            new_score = min(current["score"] + impact, 10.0)
-            old_score = current["score"]
+        if row is not None:
+            old_score = self._scores[row]
+            self._remove_from_accumulators(old_score, self._velocities[row])
+            self._raw[row] += impact
+            new_score = min(self._raw[row], 10.0)
             velocity = (new_score - old_score) / max(1, impact)
             
-            self.state["skills"][name_lower] = {
-                "score": round(new_score, 2),
-                "velocity": round(velocity, 3),
-                "source": source,
-                "last_update": datetime.now().isoformat()
-            }
+            self._scores[row] = round(new_score, 2)
+            self._velocities[row] = round(velocity, 3)
+            self._sources[row] = sys.intern(source)
+            self._updated_at[row] = now
+            self._trend.observe(row, now, self._scores[row])
         else:
-            self.state["skills"][name_lower] = {
-                "score": round(min(impact, 10.0), 2),
-                "velocity": round(impact * 0.1, 3),
-                "source": source,
-                "last_update": datetime.now().isoformat()
-            }
+            row = len(self._names)
+            name_lower = sys.intern(name_lower)
+            self._index[name_lower] = row
+            self._names.append(name_lower)
+            self._sources.append(sys.intern(source))
+            self._raw.append(impact)
+            self._scores.append(round(min(impact, 10.0), 2))
+            self._velocities.append(round(impact * 0.1, 3))
+            self._updated_at.append(now)
+            self._trend.add_row(now, self._scores[row])
         
-        self.recalculate_attributes()
-        self.state["last_updated"] = datetime.now().isoformat()
-        return self.state["skills"][name_lower]
+        self._skills_view = None
+        self._bump()
+        self._add_to_accumulators(self._scores[row], self._velocities[row])
+        self.history.record(row, now, self._scores[row])
+        
+        if not self._batch_depth:
+            self._publish_attributes()
+            self._last_updated = now
+        return self._skill_entry(row)
 
-    def recalculate_attributes(self):
-        """Recalculate global attributes from all skills"""
-        skills = self.state["skills"]
-        if not skills:
+    def update_skills(self, updates: Iterable[Tuple[str, float, str]]) -> List[Dict]:
+        """
+        Apply many (name, impact, source) updates, publishing the global
+        attributes once at the end instead of after every skill
+        """
+        self._batch_depth += 1
+        try:
+            results = [self.update_skill(name, impact, source) for name, impact, source in updates]
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self._publish_attributes()
+            self._touch()
+        return results
+
+    def retract_skill(self, name: str, amount: float) -> Optional[Dict]:
+        """
+        Take back `amount` previously added to a skill; the skill is dropped
+        once nothing is left. Returns the updated entry, or None if dropped
+        """
+        row = self._index.get(name.lower().strip())
+        if row is None:
+            return None
+        entry = self._retract_row(row, amount)
+        if entry is None:
+            self._drop_rows((row,))
+        if not self._batch_depth:
+            self._publish_attributes()
+            self._touch()
+        return entry
+
+    def retract_skills(self, retractions: Iterable[Tuple[str, float]]):
+        """
+        Apply many (name, amount) retractions, publishing attributes once
+        and dropping every emptied skill in a single compaction
+        """
+        emptied = set()
+        for name, amount in retractions:
+            row = self._index.get(name.lower().strip())
+            if row is not None and row not in emptied and self._retract_row(row, amount) is None:
+                emptied.add(row)
+        if emptied:
+            self._drop_rows(emptied)
+        if not self._batch_depth:
+            self._publish_attributes()
+            self._touch()
+
+    def _retract_row(self, row: int, amount: float) -> Optional[Dict]:
+        """
+        Take `amount` off one row. Returns the updated entry, or None once
+        nothing is left; the caller then drops the row
+        """
+        now = time.time()
+        old_score = self._scores[row]
+        self._remove_from_accumulators(old_score, self._velocities[row])
+        self._raw[row] -= amount
+        self._skills_view = None
+        self._bump()
+        if self._raw[row] <= 1e-9:
+            return None
+        new_score = min(self._raw[row], 10.0)
+        self._scores[row] = round(new_score, 2)
+        self._velocities[row] = round((new_score - old_score) / max(1, amount), 3)
+        self._updated_at[row] = now
+        self._trend.observe(row, now, self._scores[row])
+        self._add_to_accumulators(self._scores[row], self._velocities[row])
+        self.history.record(row, now, self._scores[row])
+        return self._skill_entry(row)
+
+    def _drop_rows(self, rows: Iterable[int]):
+        """Remove skill rows, with their trend statistics and history, in one compaction pass"""
+        dropped = set(rows)
+        if not dropped:
+            return
+        keep = [row for row in range(len(self._names)) if row not in dropped]
+        renumber = [-1] * len(self._names)
+        for new, old in enumerate(keep):
+            renumber[old] = new
+        self._names = [self._names[row] for row in keep]
+        self._sources = [self._sources[row] for row in keep]
+        for column in ("_raw", "_scores", "_velocities", "_updated_at"):
+            values = getattr(self, column)
+            setattr(self, column, array("d", [values[row] for row in keep]))
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._trend.keep_rows(keep)
+        self.history.renumber(renumber)
+
+    def _publish_attributes(self):
+        """Write the global attributes from the running aggregates, O(1)"""
+        count = self._count
+        if not count:
             self.state["attributes"] = {
                 "velocity": 0.0,
                 "consistency": 0.0,
@@ -60,99 +270,365 @@ class SkillTwin:
             }
             return
 
-        scores = [s["score"] for s in skills.values()]
-        velocities = [s["velocity"] for s in skills.values()]
-        
-        avg_score = sum(scores) / len(scores)
-        avg_velocity = sum(velocities) / len(velocities)
-        
         # Consistency = how evenly distributed skills are (lower std dev = higher consistency)
-        if len(scores) > 1:
-            variance = sum((s - avg_score) ** 2 for s in scores) / len(scores)
-            std_dev = variance ** 0.5
+        if count > 1:
+            std_dev = (self._score_m2 / count) ** 0.5
             consistency = max(0, 1 - (std_dev / 5))  # Normalize
         else:
             consistency = 1.0
 
         self.state["attributes"] = {
-            "velocity": round(avg_velocity, 3),
+            "velocity": round(self._velocity_sum / count, 3),
             "consistency": round(consistency, 3),
-            "total_skills": len(skills),
-            "avg_score": round(avg_score, 2)
+            "total_skills": count,
+            "avg_score": round(self._score_mean, 2)
         }
 
+    def recalculate_attributes(self):
+        """Rebuild the running aggregates from all skills, then publish them"""
+        self._reset_accumulators()
+        for score, velocity in zip(self._scores, self._velocities):
+            self._add_to_accumulators(score, velocity)
+        self._publish_attributes()
+
     def simulate_future(self, months: int = 12) -> Dict:
         """
         Simulate future skill growth
-        Formula: Future_Score = Current_Score + (Global_Velocity * (months / 12))
+        Skills with enough history follow their least-squares trend; the rest
+        use Future_Score = Current_Score + (Combined_Velocity * (months / 12) * 2)
+        Memoized per (version, months)
+        """
+        return self._memoized(("future", months), lambda: self._simulate_future(months))
+
+    def _project(self, months: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        global_velocity = self.state["attributes"]["velocity"]
+        Project every skill to every horizon in one pass: skills x horizons
+        future scores with their confidence band, the velocity used per skill,
+        and which skills had a fitted trend
+        """
+        scores = np.frombuffer(self._scores, dtype=np.float64) if self._names else np.zeros(0)
+        velocities = np.frombuffer(self._velocities, dtype=np.float64) if self._names else np.zeros(0)
+        
+        # Combined velocity (global + individual), amplified for visibility
+        combined = (self.state["attributes"]["velocity"] + velocities) / 2
+        fit = self._trend.fit()
+        # A fitted slope is score per month; in combined's units growth = velocity * months / 6
+        velocity = np.where(fit["fitted"], fit["slope"] * 6, combined)
+        growth = velocity[:, None] * (months / 12)[None, :] * 2
+        future = np.clip(scores[:, None] + growth, 0.0, 10.0)
+        half_width = TrendEstimator.band(fit, months)
+        return {
+            "scores": scores,
+            "velocity": velocity,
+            "slope_se": np.sqrt(fit["sigma2"] / fit["stt"]),  # Score per month; 0 without a trend
+            "fitted": fit["fitted"],
+            "future": np.round(future, 2),
+            "low": np.round(np.clip(future - half_width, 0.0, 10.0), 2),
+            "high": np.round(np.clip(future + half_width, 0.0, 10.0), 2)
+        }
+
+    def _prediction_confidence(self, projection: Dict[str, np.ndarray]) -> float:
+        """Mean narrowness of the fitted bands at the furthest horizon, else by skill count"""
+        fitted = projection["fitted"]
+        if not fitted.any():
+            return min(0.95, 0.5 + (len(self._names) * 0.05))
+        widths = projection["high"][fitted, -1] - projection["low"][fitted, -1]
+        return round(float(np.clip(1 - widths / 10, 0.0, 0.95).mean()), 3)
+
+    def _simulate_future(self, months: int) -> Dict:
+        projection = self._project(np.asarray([months], dtype=np.float64))
         future_skills = {}
         
-        for name, skill in self.state["skills"].items():
-            current_score = skill["score"]
-            skill_velocity = skill["velocity"]
-            
-            # Combined velocity (global + individual)
-            combined_velocity = (global_velocity + skill_velocity) / 2
-            
-            # Calculate future score
-            growth = combined_velocity * (months / 12) * 2  # Amplify for visibility
-            future_score = min(current_score + growth, 10.0)
-            
+        for row, name in enumerate(self._names):
+            current_score = round(self._scores[row], 2)
+            future_score = float(projection["future"][row, 0])
             future_skills[name] = {
-                "current_score": round(current_score, 2),
-                "future_score": round(future_score, 2),
+                "current_score": current_score,
+                "future_score": future_score,
                 "growth": round(future_score - current_score, 2),
-                "velocity_used": round(combined_velocity, 3)
+                "velocity_used": round(float(projection["velocity"][row]), 3),
+                "low": float(projection["low"][row, 0]),
+                "high": float(projection["high"][row, 0]),
+                "method": "trend" if projection["fitted"][row] else "heuristic"
             }
 
         return {
             "months_simulated": months,
-            "current_state": self.state["skills"],
+            "current_state": self.get_skills(),
             "future_state": future_skills,
-            "prediction_confidence": min(0.95, 0.5 + (len(self.state["skills"]) * 0.05))
+            "prediction_confidence": self._prediction_confidence(projection)
+        }
+
+    def simulate_horizons(self, horizons: Iterable[int], columnar: bool = False) -> Dict:
+        """
+        Simulate future skill growth for many horizons at once
+        Same model as simulate_future, computed as one skills x horizons matrix
+        """
+        horizons = tuple(horizons)
+        return self._memoized(
+            ("horizons", horizons, columnar),
+            lambda: self._simulate_horizons(horizons, columnar)
+        )
+
+    def _simulate_horizons(self, horizons: Tuple[int, ...], columnar: bool) -> Dict:
+        months = np.asarray(horizons, dtype=np.float64)
+        projection = self._project(months)
+        future, low, high = projection["future"], projection["low"], projection["high"]
+        velocity = projection["velocity"]
+        
+        result = {
+            "horizons": months.astype(int).tolist(),
+            "prediction_confidence": self._prediction_confidence(projection)
+        }
+        if columnar:
+            # One list per column; the score matrices are row-major, one row per skill
+            result["future_state"] = {
+                "skills": list(self._names),
+                "current_score": np.round(projection["scores"], 2).tolist(),
+                "velocity_used": np.round(velocity, 3).tolist(),
+                "method": np.where(projection["fitted"], "trend", "heuristic").tolist(),
+                "future_scores": future.ravel().tolist(),
+                "low": low.ravel().tolist(),
+                "high": high.ravel().tolist()
+            }
+        else:
+            result["future_state"] = {
+                name: {
+                    "current_score": round(self._scores[row], 2),
+                    "future_scores": future[row].tolist(),
+                    "low": low[row].tolist(),
+                    "high": high[row].tolist(),
+                    "velocity_used": round(float(velocity[row]), 3),
+                    "method": "trend" if projection["fitted"][row] else "heuristic"
+                }
+                for row, name in enumerate(self._names)
+            }
+        return result
+
+    def simulate_scenarios(
+        self,
+        months: int = 12,
+        paths: int = SCENARIO_PATHS,
+        seed: int = 0,
+        velocity_noise: float = SCENARIO_VELOCITY_NOISE,
+        boosts: Optional[Dict[str, float]] = None,
+        percentiles: Iterable[float] = (10, 50, 90)
+    ) -> Dict:
+        """
+        Monte Carlo growth bands per skill and month
+        Paths vary each skill's velocity around simulate_future's, by
+        `velocity_noise` of it plus the trend's standard error, and add a
+        random shock every month. `boosts` adds
+        score per month to chosen skills (a study plan); boosted skills the
+        twin lacks start from 0. Seeded, so memoized like the other simulations
+        """
+        boosts = {name.lower().strip(): boost for name, boost in (boosts or {}).items()}
+        percentiles = tuple(percentiles)
+        key = ("scenarios", months, paths, seed, velocity_noise, tuple(sorted(boosts.items())), percentiles)
+        return self._memoized(
+            key,
+            lambda: self._simulate_scenarios(months, paths, seed, velocity_noise, boosts, percentiles)
+        )
+
+    def _simulate_scenarios(self, months: int, paths: int, seed: int, velocity_noise: float,
+                            boosts: Dict[str, float], percentiles: Tuple[float, ...]) -> Dict:
+        projection = self._project(np.asarray([months], dtype=np.float64))
+        names = list(self._names) + [name for name in boosts if name not in self._index]
+        extra = len(names) - len(self._names)
+        scores = np.concatenate([projection["scores"], np.zeros(extra)])
+        # Velocities are in the projection's units (growth = velocity * months / 6)
+        velocity = np.concatenate([projection["velocity"] / 6, np.zeros(extra)])
+        slope_se = np.concatenate([projection["slope_se"], np.zeros(extra)])
+        velocity_sd = np.hypot(velocity_noise * np.maximum(np.abs(velocity), MIN_VELOCITY_SPREAD), slope_se)
+        velocity += np.array([boosts.get(name, 0.0) for name in names])
+        
+        bands = growth_bands(scores, velocity, velocity_sd, months, paths, percentiles, seed)
+        labels = [f"p{p:g}" for p in percentiles]
+        return {
+            "months": list(range(1, months + 1)),
+            "paths": paths,
+            "seed": seed,
+            "future_state": {
+                name: {
+                    "current_score": round(float(scores[row]), 2),
+                    "boost": boosts.get(name, 0.0),
+                    **{label: bands[p][row].tolist() for label, p in zip(labels, percentiles)}
+                }
+                for row, name in enumerate(names)
+            }
         }
 
     def set_name(self, name: str):
         """Set the twin's name"""
         self.state["name"] = name
-        self.state["last_updated"] = datetime.now().isoformat()
+        self._bump()
+        self._touch()
+
+    def raise_attributes(self, velocity: float, consistency: float):
+        """Lift global velocity/consistency to at least the given values (e.g. from GitHub)"""
+        attributes = self.state["attributes"]
+        attributes["velocity"] = max(attributes["velocity"], velocity)
+        attributes["consistency"] = max(attributes["consistency"], consistency)
+        self._bump()
+
+    def replace_skills(self, updates: Iterable[Tuple[str, float, str]]):
+        """
+        Replace every skill with (name, impact, source) updates, as a new
+        resume or a full profile rebuild does. Scores and velocities come
+        out as after clear_skills and update_skills, but skills that stay
+        keep their rows, score history and trend statistics; the others are
+        dropped with theirs
+        """
+        updates = list(updates)
+        incoming = {name.lower().strip() for name, _, _ in updates}
+        self._drop_rows(row for row, name in enumerate(self._names) if name not in incoming)
+        restart = set(self._names)
+        self._reset_accumulators()
+        self.sync_records = None
+        self._batch_depth += 1
+        try:
+            for name, impact, source in updates:
+                name_lower = name.lower().strip()
+                if name_lower not in restart:
+                    self.update_skill(name, impact, source)
+                    continue
+                # First update of a kept skill: values as for a new one, history and trend continued
+                restart.discard(name_lower)
+                row = self._index[name_lower]
+                now = time.time()
+                self.update_count += 1
+                self._raw[row] = impact
+                self._scores[row] = round(min(impact, 10.0), 2)
+                self._velocities[row] = round(impact * 0.1, 3)
+                self._sources[row] = sys.intern(source)
+                self._updated_at[row] = now
+                self._trend.observe(row, now, self._scores[row])
+                self._add_to_accumulators(self._scores[row], self._velocities[row])
+                self.history.record(row, now, self._scores[row])
+        finally:
+            self._batch_depth -= 1
+        self._skills_view = None
+        self._bump()
+        if not self._batch_depth:
+            self._publish_attributes()
+            self._touch()
 
     def clear_skills(self):
-        """Clear only skills (called before processing a new resume)"""
-        self.state["skills"] = {}
+        """Clear only skills, with their history"""
+        self._clear_columns()
         self.state["resume_uploaded"] = False
         self.recalculate_attributes()
-        self.state["last_updated"] = datetime.now().isoformat()
+        self._bump()
+        self._touch()
 
     def reset(self):
         """Full reset to blank state"""
+        self._reset_accumulators()
+        self._clear_columns()
         self.state = {
             "name": "Guest",
-            "skills": {},
             "attributes": {
                 "velocity": 0.0,
                 "consistency": 0.0,
                 "total_skills": 0
             },
-            "last_updated": datetime.now().isoformat(),
             "github_connected": False,
             "resume_uploaded": False
         }
+        self._bump()
+        self._touch()
+
+    def get_skills(self) -> Dict[str, Dict]:
+        """Skills in their public JSON shape, rebuilt only after a change"""
+        if self._skills_view is None:
+            self._skills_view = {name: self._skill_entry(row) for row, name in enumerate(self._names)}
+        return self._skills_view
 
     def get_state(self) -> Dict[str, Any]:
         """Return current state"""
-        return self.state
+        state = self.state
+        return {
+            "name": state["name"],
+            "skills": self.get_skills(),
+            "attributes": state["attributes"],
+            "last_updated": _iso(self._last_updated),
+            "github_connected": state["github_connected"],
+            "resume_uploaded": state["resume_uploaded"]
+        }
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Everything needed to rebuild this twin, as plain JSON-able data"""
+        return {
+            "v": 1,
+            "state": self.state,
+            "last_updated": self._last_updated,
+            "names": self._names,
+            "sources": self._sources,
+            "raw": self._raw.tolist(),
+            "scores": self._scores.tolist(),
+            "velocities": self._velocities.tolist(),
+            "updated_at": self._updated_at.tolist(),
+            "history": self.history.to_snapshot(),
+            "trend": self._trend.to_snapshot(),
+            "sync_records": None if self.sync_records is None else [
+                [list(key), [list(c) for c in contributions]]
+                for key, contributions in self.sync_records.items()
+            ]
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "SkillTwin":
+        """Inverse of to_snapshot"""
+        twin = cls()
+        twin._names = [sys.intern(name) for name in snapshot["names"]]
+        twin._index = {name: row for row, name in enumerate(twin._names)}
+        twin._sources = [sys.intern(source) for source in snapshot["sources"]]
+        twin._raw = array("d", snapshot["raw"])
+        twin._scores = array("d", snapshot["scores"])
+        twin._velocities = array("d", snapshot["velocities"])
+        twin._updated_at = array("d", snapshot["updated_at"])
+        twin._last_updated = snapshot["last_updated"]
+        if "history" in snapshot:
+            twin.history = SkillHistory.from_snapshot(snapshot["history"])
+        if "trend" in snapshot:
+            twin._trend = TrendEstimator(snapshot["trend"])
+        else:
+            for timestamp, score in zip(twin._updated_at, twin._scores):
+                twin._trend.add_row(timestamp, score)
+        if snapshot["sync_records"] is not None:
+            twin.sync_records = {
+                tuple(key): tuple(tuple(c) for c in contributions)
+                for key, contributions in snapshot["sync_records"]
+            }
+        twin.recalculate_attributes()
+        # Published attributes may have been raised above the aggregates (GitHub)
+        twin.state = snapshot["state"]
+        return twin
+
+    def get_history(self, skill: Optional[str] = None, start: Optional[float] = None,
+                    end: Optional[float] = None, resolution: str = "auto") -> Dict[str, List[Dict]]:
+        """Score history in its public JSON shape, for one skill or all of them"""
+        names = [skill.lower().strip()] if skill else self._names
+        rows = self._index  # Unknown skills query row -1, which has no points
+        return {
+            name: [
+                {
+                    "timestamp": _iso(t),
+                    "score": round(score, 2),
+                    "min": round(low, 2),
+                    "max": round(high, 2),
+                    "count": count,
+                    "resolution": tier
+                }
+                for t, score, low, high, count, tier in self.history.query(rows.get(name, -1), start, end, resolution)
+            ]
+            for name in names
+        }
 
     def get_skill_names(self) -> list:
         """Get list of skill names for chart labels"""
-        return list(self.state["skills"].keys())
+        return list(self._names)
 
     def get_skill_scores(self) -> list:
         """Get list of skill scores for chart data"""
-        return [s["score"] for s in self.state["skills"].values()]
-
-
-# Singleton instance
-skill_twin = SkillTwin()
+        return self._scores.tolist()
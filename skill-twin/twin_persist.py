@@ -0,0 +1,154 @@
+"""
+Twin Persist - Write-behind SQLite storage for twins
+Changed twins are marked dirty on the request path and written in batches by
+a background task, one transaction per flush, so requests never wait on disk.
+The database runs in WAL mode and each batch commits atomically: a crash
+loses at most the last flush interval, never a half-written twin. Nothing is
+loaded at startup; TwinStore restores a twin the first time it is asked for
+"""
+
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from twin_core import SkillTwin
+
+# Defaults, overridable through the environment
+TWIN_STATE_DB = os.getenv("SKILL_TWIN_STATE_DB")  # unset = memory only
+TWIN_FLUSH_INTERVAL = float(os.getenv("SKILL_TWIN_STATE_FLUSH_INTERVAL", "1.0"))
+TWIN_FLUSH_BATCH = int(os.getenv("SKILL_TWIN_STATE_FLUSH_BATCH", "500"))
+
+
+class TwinPersistence:
+    """
+    Session ID -> twin snapshot table with a write-behind queue.
+    A twin marked dirty several times between flushes is written once
+    """
+
+    def __init__(self, db_path: Optional[str] = TWIN_STATE_DB, flush_interval: float = TWIN_FLUSH_INTERVAL,
+                 batch_size: int = TWIN_FLUSH_BATCH):
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self._dirty: Dict[str, SkillTwin] = {}
+        self._writing: Dict[str, SkillTwin] = {}  # Batch currently on its way to disk
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fsync on checkpoint
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS twins ("
+                "session_id TEXT PRIMARY KEY, snapshot TEXT NOT NULL, saved_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None
+
+    def __len__(self) -> int:
+        """Twins waiting to be written"""
+        return len(self._dirty)
+
+    async def start(self):
+        """Start the flusher; call from the app's lifespan"""
+        if self._db is not None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._flusher())
+
+    async def stop(self):
+        """Stop the flusher and write out everything still dirty"""
+        if self._task is not None:
+            # Let the flusher finish its current batch rather than cancelling mid-write
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        while self._dirty:
+            await self.flush()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    def mark_dirty(self, session_id: str, twin: SkillTwin):
+        """Queue a twin for the next flush"""
+        if self._db is None:
+            return
+        self._dirty[session_id] = twin
+        if len(self._dirty) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    def _write(self, rows: List[Tuple[str, str, float]]):
+        with self._db_lock:
+            with self._db:  # One transaction per batch
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO twins (session_id, snapshot, saved_at) VALUES (?, ?, ?)",
+                    rows
+                )
+
+    async def flush(self):
+        """Write up to one batch of dirty twins"""
+        if not self._dirty or self._db is None:
+            return
+        now = time.time()
+        batch = [(session_id, self._dirty.pop(session_id)) for session_id in list(self._dirty)[:self.batch_size]]
+        # Snapshot on the loop thread, where twins are mutated; only disk I/O leaves it
+        rows = [(session_id, json.dumps(twin.to_snapshot()), now) for session_id, twin in batch]
+        self._writing.update(batch)
+        try:
+            await asyncio.to_thread(self._write, rows)
+        except Exception:
+            # Requeue, unless the twin was marked dirty again meanwhile
+            for session_id, twin in batch:
+                self._dirty.setdefault(session_id, twin)
+            raise
+        finally:
+            for session_id, _ in batch:
+                self._writing.pop(session_id, None)
+
+    async def _flusher(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._stopping:
+                return
+            try:
+                while self._dirty:
+                    await self.flush()
+                    if len(self._dirty) < self.batch_size:
+                        break
+            except sqlite3.Error:
+                pass  # Batch stays dirty; retried on the next interval
+
+    def pending(self, session_id: str) -> Optional[SkillTwin]:
+        """A twin marked dirty but not yet on disk (e.g. evicted meanwhile)"""
+        return self._dirty.get(session_id) or self._writing.get(session_id)
+
+    def _read(self, session_id: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._db.execute("SELECT snapshot FROM twins WHERE session_id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    async def load(self, session_id: str) -> Optional[SkillTwin]:
+        """The twin last saved for a session, or None"""
+        if self._db is None:
+            return None
+        twin = self.pending(session_id)
+        if twin is not None:
+            return twin
+        snapshot = await asyncio.to_thread(self._read, session_id)
+        if snapshot is None:
+            return None
+        return SkillTwin.from_snapshot(json.loads(snapshot))
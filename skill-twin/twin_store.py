@@ -0,0 +1,112 @@
+"""
+Twin Store - One SkillTwin per session
+Replaces the old module-level singleton: twins are looked up in O(1) by a
+session ID derived from the caller's auth token, serialized per twin with
+an asyncio lock, and evicted when idle or when the store is full. With a
+TwinPersistence attached, twins are restored from disk on first access and
+queued for write-behind after every locked update
+"""
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+import asyncio
+import hashlib
+import os
+import time
+
+from metrics import record_skill_updates
+from twin_core import SkillTwin
+from twin_persist import TwinPersistence
+
+# Defaults, overridable through the environment
+TWIN_STORE_MAX_TWINS = int(os.getenv("SKILL_TWIN_MAX_TWINS", "10000"))
+TWIN_STORE_IDLE_TTL = float(os.getenv("SKILL_TWIN_IDLE_TTL", "3600"))
+
+# Session used by callers that send no token
+GUEST_SESSION = "guest"
+
+
+def session_id_for_token(token: Optional[str]) -> str:
+    """
+    Stable session ID for an auth token. The token is hashed rather than
+    decoded: its claims are not verified here, so a hash is the only part
+    of it a caller cannot forge
+    """
+    if not token:
+        return GUEST_SESSION
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+class _Entry:
+    __slots__ = ("twin", "lock", "last_access")
+
+    def __init__(self, twin: Optional[SkillTwin] = None):
+        self.twin = twin if twin is not None else SkillTwin()
+        self.lock = asyncio.Lock()
+        self.last_access = time.monotonic()
+
+
+class TwinStore:
+    """
+    Bounded map of session ID -> SkillTwin, ordered by last access.
+    Twins idle longer than `idle_ttl` seconds are dropped, and the least
+    recently used twin goes first once `max_twins` is reached. A twin whose
+    lock is held is never evicted.
+    """
+
+    def __init__(self, max_twins: int = TWIN_STORE_MAX_TWINS, idle_ttl: float = TWIN_STORE_IDLE_TTL,
+                 persistence: Optional[TwinPersistence] = None):
+        self.max_twins = max(1, max_twins)
+        self.idle_ttl = idle_ttl
+        self.persistence = persistence
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float, keep: str):
+        """Drop expired twins, then least recently used ones over capacity"""
+        entries = self._entries
+        victims = []
+        for session_id, entry in entries.items():
+            expired = now - entry.last_access > self.idle_ttl
+            if not expired and len(entries) - len(victims) <= self.max_twins:
+                break  # Everything after this was used more recently
+            if session_id != keep and not entry.lock.locked():
+                victims.append(session_id)
+        for session_id in victims:
+            del entries[session_id]
+
+    async def _entry(self, session_id: str) -> _Entry:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            twin = await self.persistence.load(session_id) if self.persistence is not None else None
+            # Another caller may have restored the same twin while we awaited
+            entry = self._entries.get(session_id)
+            if entry is None:
+                entry = _Entry(twin)
+                self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        now = time.monotonic()
+        entry.last_access = now
+        self._evict(now, session_id)
+        return entry
+
+    async def get(self, session_id: str) -> SkillTwin:
+        """Return the session's twin for reading, restoring or creating it if needed"""
+        return (await self._entry(session_id)).twin
+
+    @asynccontextmanager
+    async def acquire(self, session_id: str) -> AsyncIterator[SkillTwin]:
+        """Hold the session's twin exclusively for a read-modify-write"""
+        entry = await self._entry(session_id)
+        async with entry.lock:
+            updates = entry.twin.update_count
+            try:
+                yield entry.twin
+            finally:
+                entry.last_access = time.monotonic()
+                record_skill_updates(entry.twin.update_count - updates)
+                if self.persistence is not None:
+                    self.persistence.mark_dirty(session_id, entry.twin)